@@ -1,24 +1,51 @@
 import time
 import json
+import hashlib
 import re
 import requests
 import questionary
+from functools import lru_cache
 from typing import Optional
 
 from .ui import console, configure_questionary_style
 from .config import (
     AUTH_TOKEN, API_URL, TOKEN_INCREMENT, MODEL, MAX_TOKENS, TEMPERATURE,
-    USE_EMOJIS, logger, DEBUG
+    USE_EMOJIS, PROMPT_CACHING, TOKEN_COUNT_CACHE, logger, DEBUG
 )
-from .git_utils import parse_diff
+from .git_utils import parse_diff, change_totals
 from .ui import printer
-from .prompts import SYSTEM_MESSAGE, USER_MSG_APPENDIX, SYSTEM_MESSAGE_EMOJI, SUMMARIZE_COMMIT_PROMPT, USER_MSG_APPENDIX_EMOJI
+# Prompt texts are loaded on first attribute access; keep the module reference
+from . import prompts
+from .prompts import build_system_blocks, assemble_diff_content
 
 # If an actual "count_tokens_in_string" is needed, import from a local module:
 from count_tokens import count_tokens_in_string
 
 # Import the new LLM helper function.
 from .llm import get_chat_completion
+
+@lru_cache(maxsize=None)
+def _static_prompt_tokens(prompt: str) -> int:
+    """
+    Token count of a fixed prompt text. Memoized per process and persisted in
+    TOKEN_COUNT_CACHE under a digest of the text, so an edited prompt is
+    simply counted again.
+    """
+    key = "cl100k_base:" + hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+    try:
+        count = TOKEN_COUNT_CACHE.get(key)
+        if count is None:
+            count = count_tokens_in_string(prompt)
+            TOKEN_COUNT_CACHE.set(key, count)
+        return count
+    except Exception as e:
+        logger.debug(f"Token count cache unavailable: {e}")
+        return count_tokens_in_string(prompt)
+
+def _system_message(prompt: str) -> dict:
+    """System message for `prompt`, as a cacheable content block when prompt caching is enabled."""
+    return {"role": "system", "content": build_system_blocks(prompt) if PROMPT_CACHING else prompt}
+
 def extract_from_codeblocks(text: str) -> str:
     """
     Extract text from code blocks enclosed within triple backticks or more.
@@ -190,22 +217,23 @@ def generate_commit_message(MODEL: str, diff: str, custom_notes: Optional[str] =
     """
     max_tokens = MAX_TOKENS
     logger.debug(USE_EMOJIS)
-    INSTRUCT_PROMPT = SYSTEM_MESSAGE_EMOJI if USE_EMOJIS else SYSTEM_MESSAGE
+    INSTRUCT_PROMPT = prompts.SYSTEM_MESSAGE_EMOJI if USE_EMOJIS else prompts.SYSTEM_MESSAGE
     logger.debug("Entering generate_commit_message function.")
 
     # Build user content with escaped and formatted diff, plus optional custom notes after diff
     formatted_diff = format_diff_with_codeblocks(diff)
-    user_content = "START BY CAREFULLY REVIEWING THE FOLLOWING DIFF(S):\n\n" + formatted_diff
-    if custom_notes:
-        user_content += "\n\n## Custom User Notes\n```\n" + custom_notes + "\n```\n"
-    user_content += (USER_MSG_APPENDIX if not USE_EMOJIS else USER_MSG_APPENDIX_EMOJI)
+    diff_content = assemble_diff_content(formatted_diff, custom_notes)
+    appendix = prompts.USER_MSG_APPENDIX if not USE_EMOJIS else prompts.USER_MSG_APPENDIX_EMOJI
+    user_content = diff_content + appendix
     
     messages = [
-        {"role": "system", "content": INSTRUCT_PROMPT},
+        _system_message(INSTRUCT_PROMPT),
         {"role": "user", "content": user_content},
     ]
 
-    request_tokens = count_tokens_in_string(INSTRUCT_PROMPT + user_content)
+    # Only the diff part changes between requests; the fixed prompt counts are memoized
+    static_tokens = _static_prompt_tokens(INSTRUCT_PROMPT) + _static_prompt_tokens(appendix)
+    request_tokens = static_tokens + count_tokens_in_string(diff_content)
     logger.debug(f"request_tokens {request_tokens}")
 
 
@@ -220,19 +248,16 @@ def generate_commit_message(MODEL: str, diff: str, custom_notes: Optional[str] =
         if request_tokens > max_tokens:
             if DEBUG:
                 logger.warning(f"Request exceeds max tokens ({request_tokens}/{MAX_TOKENS})\nTruncating...")
-            truncated_diff = truncate_diff(diff, INSTRUCT_PROMPT, USER_MSG_APPENDIX, max_tokens)
+            truncated_diff = truncate_diff(diff, INSTRUCT_PROMPT, prompts.USER_MSG_APPENDIX, max_tokens)
             # Rebuild user content with formatted truncated diff but preserve custom notes
             formatted_truncated_diff = format_diff_with_codeblocks(truncated_diff)
-            truncated_user_content = "START BY CAREFULLY REVIEWING THE FOLLOWING DIFF(S):\n\n" + formatted_truncated_diff
-            if custom_notes:
-                truncated_user_content += "\n\n## Custom User Notes\n```\n" + custom_notes + "\n```\n"
-            truncated_user_content += (USER_MSG_APPENDIX if not USE_EMOJIS else USER_MSG_APPENDIX_EMOJI)
+            truncated_diff_content = assemble_diff_content(formatted_truncated_diff, custom_notes)
             
             messages = [
-                {"role": "system", "content": INSTRUCT_PROMPT},
-                {"role": "user", "content": truncated_user_content}
+                _system_message(INSTRUCT_PROMPT),
+                {"role": "user", "content": truncated_diff_content + appendix}
             ]
-            request_tokens = count_tokens_in_string(INSTRUCT_PROMPT + truncated_user_content)
+            request_tokens = static_tokens + count_tokens_in_string(truncated_diff_content)
             if DEBUG:
                 logger.debug(f"After truncation, request tokens are {request_tokens}/{max_tokens}.")
 
@@ -245,8 +270,7 @@ def generate_commit_message(MODEL: str, diff: str, custom_notes: Optional[str] =
                 console.print("[bold red]Commit generation aborted by user.[/bold red]")
                 return ""
 
-        deletions = sum(change["deletions"] for change in parse_diff(diff))
-        additions = sum(change["additions"] for change in parse_diff(diff))
+        additions, deletions = change_totals(parse_diff(diff))
         logger.debug(f"deletions: {deletions}, additions: {additions}")
         if additions > 0:
             if deletions > 2 * additions:
@@ -319,7 +343,7 @@ def generate_summary(text: str) -> Optional[str]:
     """
     try:
         messages = [
-            {"role": "system", "content": SUMMARIZE_COMMIT_PROMPT},
+            _system_message(prompts.SUMMARIZE_COMMIT_PROMPT),
             {"role": "user", "content": text}
         ]
         with console.status("[bold green]Analyzing changes to staged files...[/bold green]") as status:
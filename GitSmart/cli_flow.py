@@ -4,9 +4,11 @@ import os
 import re
 import sys
 import time
+import asyncio
 import threading
 import questionary
 from questionary import Style
+from prompt_toolkit.patch_stdout import patch_stdout
 from typing import List, Dict, Any, Tuple, Optional
 # Git-themed questionary style
 fancy_questionary_style = Style([
@@ -34,6 +36,7 @@ from .config import logger, MODEL_CACHE, MODEL, DEFAULT_MODEL, DEBUG
 from .ui import console, printer, create_styled_table, configure_questionary_style
 from .git_utils import (
     parse_diff,
+    change_totals,
     get_git_diff,
     get_file_diff,
     stage_files,
@@ -62,15 +65,18 @@ class MenuNavigationException(Exception):
     """Raised when user wants to navigate back from a submenu (e.g., Ctrl-C)."""
     pass
 
-def main_menu_prompt(MODEL: str, title: str, choices: list) -> str:
+# Styled questionary choices for the last menu, reused while the menu text is unchanged
+_styled_choices_cache: Dict[str, Any] = {"key": None, "val": None}
+
+def build_styled_choices(choices: list) -> Tuple[list, Optional[str]]:
     """
-    Enhanced UI prompt for the main menu with questionary + custom style.
-    Uses Git-themed colors and highlights 'Generate Commit' if staged changes exist.
-    Always shows "Generate Commit" first when available, with colored additions and deletions.
-    Additions are consistently shown in green (+) and deletions in red (-) for better visibility.
+    Turn main-menu strings into styled questionary choices, with 'Generate Commit'
+    moved first. Returns (styled_choices, default_choice).
     """
-    # Check for staged changes to highlight 'Generate Commit'
-    _, _, staged_changes, unstaged_changes = get_status()
+    key = tuple(choices)
+    if _styled_choices_cache["key"] == key:
+        return _styled_choices_cache["val"]
+
     styled_choices = []
     commit_option = None
     default_choice = None
@@ -82,7 +88,8 @@ def main_menu_prompt(MODEL: str, title: str, choices: list) -> str:
             break
 
     # Add the generate commit option first if it exists
-    if commit_option and staged_changes:
+    # (get_menu_options only offers it when there are staged changes)
+    if commit_option:
         styled_choices.append(
             questionary.Choice(
                 title=f"🌟 {commit_option}", # Style will be handled by 'highlighted' in fancy_questionary_style
@@ -124,13 +131,49 @@ def main_menu_prompt(MODEL: str, title: str, choices: list) -> str:
         else: # Corresponds to other menu items or if regex doesn't match
             styled_choices.append(c)
 
-    return questionary.select(
+    result = (styled_choices, default_choice)
+    _styled_choices_cache.update(key=key, val=result)
+    return result
+
+def main_menu_prompt(MODEL: str, title: str, choices: list, wakeup=None) -> Optional[str]:
+    """
+    Enhanced UI prompt for the main menu with questionary + custom style.
+    Uses Git-themed colors and highlights 'Generate Commit' if staged changes exist.
+    Always shows "Generate Commit" first when available, with colored additions and deletions.
+    Additions are consistently shown in green (+) and deletions in red (-) for better visibility.
+
+    If `wakeup` (a socket or fd) is given, it is watched on the prompt's event loop;
+    when it becomes readable the prompt erases itself, exits early and returns None.
+    """
+    styled_choices, default_choice = build_styled_choices(choices)
+
+    question = questionary.select(
         title,
         choices=styled_choices,
         style=fancy_questionary_style,
         instruction="(Use ↑/↓ to move, Enter to select)",
         default=default_choice
-    ).unsafe_ask(patch_stdout=True)
+    )
+    if wakeup is None:
+        return question.unsafe_ask(patch_stdout=True)
+
+    app = question.application
+
+    def _on_wakeup():
+        if not app.is_done:
+            # Take the prompt off the screen so the caller can keep or redraw the frame above it
+            app.erase_when_done = True
+            app.exit(result=None)
+
+    def _watch_wakeup():
+        try:
+            asyncio.get_event_loop().add_reader(wakeup, _on_wakeup)
+        except NotImplementedError:
+            # Proactor loops (Windows) can't watch sockets; refresh waits for the prompt to return
+            pass
+
+    with patch_stdout():
+        return app.run(pre_run=_watch_wakeup)
 
 def get_menu_options(
     MODEL: str,
@@ -146,8 +189,6 @@ def get_menu_options(
     it omits "Stage Files", "Unstage Files", and "Review Changes" from the menu.
     Always puts "Generate Commit" first when staged changes exist.
     """
-    from .git_utils import get_repo_name
-
     # Base choices that are always relevant
     base_choices = [
         "View Commit History",
@@ -162,8 +203,7 @@ def get_menu_options(
     dynamic_choices = []
 
     # Calculate change statistics
-    total_additions = sum(ch["additions"] for ch in staged_changes + unstaged_changes)
-    total_deletions = sum(ch["deletions"] for ch in staged_changes + unstaged_changes)
+    total_additions, total_deletions = change_totals(staged_changes, unstaged_changes)
 
     # Basic repo name fallback
     repo_name = get_repo_name() or "UnknownRepo"
@@ -174,15 +214,13 @@ def get_menu_options(
 
     # Always put Generate Commit first if we have staged changes
     if has_staged:
-        staged_additions = sum(ch["additions"] for ch in staged_changes)
-        staged_deletions = sum(ch["deletions"] for ch in staged_changes)
+        staged_additions, staged_deletions = change_totals(staged_changes)
         dynamic_choices.append(f"Generate Commit for Staged Changes ({len(staged_changes)})")
         dynamic_choices.append(f"↓ Unstage Files ({len(staged_changes)}) (+{staged_additions}, -{staged_deletions})")
 
     # Next, show Stage Files with additions/deletions count if we have unstaged changes
     if has_unstaged:
-        unstaged_additions = sum(ch["additions"] for ch in unstaged_changes)
-        unstaged_deletions = sum(ch["deletions"] for ch in unstaged_changes)
+        unstaged_additions, unstaged_deletions = change_totals(unstaged_changes)
         dynamic_choices.append(f"↑ Stage Files ({len(unstaged_changes)}) (+{unstaged_additions}, -{unstaged_deletions})")
 
     # Finally, add Review Changes if we have any changes
@@ -247,6 +285,7 @@ def handle_files(changes: List[Dict[str, Any]], action: str) -> str:
             result = stage_files(files)
         else:
             result = unstage_files(files)
+        invalidate_status_cache()
         if "Error" in result:
             if DEBUG:
                 logger.error(f"Failed to {action} files: {files}")
@@ -375,6 +414,7 @@ def handle_generate_commit(MODEL: str, diff: str, staged_changes: List[Dict[str,
     """
     Generate commit message with AI, let the user commit or edit the result.
     """
+    invalidate_status_cache()
     from rich.panel import Panel
     from rich.padding import Padding
     from rich.align import Align
@@ -635,25 +675,47 @@ def get_diff_summary_table(file_changes: List[Dict[str, Any]], color: str):
         )
     return table
 
+# Panels from the last display_status() call, reused while the change fingerprints match
+_status_panels_cache: Dict[str, Any] = {"key": None, "val": None}
+
 def display_status(
     unstaged_changes: List[Dict[str, Any]],
     staged_changes: List[Dict[str, Any]],
     staged: bool = True,
-    unstaged: bool = True
+    unstaged: bool = True,
+    key: Optional[Tuple] = None
 ):
     """
     Always display both 'Unstaged Changes' and 'Staged Changes' panels.
     If one set is empty, show 'No changes +0 -0' row to keep +/- columns consistent.
     Display unstaged changes first, then staged changes.
+    Pass the get_status_and_key() key to reuse the panels built for it last time.
     """
+    cache_key = (key, staged, unstaged) if key is not None else None
+    if cache_key is not None and _status_panels_cache["key"] == cache_key:
+        renderables = _status_panels_cache["val"]
+    else:
+        renderables = build_status_panels(unstaged_changes, staged_changes, staged, unstaged)
+        _status_panels_cache.update(key=cache_key, val=renderables)
+    for renderable in renderables:
+        console.print(renderable)
+
+def build_status_panels(
+    unstaged_changes: List[Dict[str, Any]],
+    staged_changes: List[Dict[str, Any]],
+    staged: bool = True,
+    unstaged: bool = True
+) -> List[Any]:
+    """Build the renderables display_status() prints, unstaged first."""
     from rich.panel import Panel
     from rich.padding import Padding
 
+    renderables = []
+
     # Unstaged Panel - always show first
     if unstaged:
         if unstaged_changes:
-            unstaged_additions = sum(ch["additions"] for ch in unstaged_changes)
-            unstaged_deletions = sum(ch["deletions"] for ch in unstaged_changes)
+            unstaged_additions, unstaged_deletions = change_totals(unstaged_changes)
             unstaged_table = get_diff_summary_table(unstaged_changes, "red")
             unstaged_panel = Panel(
                 Padding(unstaged_table,(1,2)),
@@ -663,14 +725,13 @@ def display_status(
                 width=50,
                 expand=True
             )
-            console.print(unstaged_panel)
+            renderables.append(unstaged_panel)
         else:
-            console.print("[dim]No unstaged changes[/dim]")
+            renderables.append("[dim]No unstaged changes[/dim]")
 
     # Staged Panel - show after unstaged
     if staged and staged_changes:
-        staged_additions = sum(ch["additions"] for ch in staged_changes)
-        staged_deletions = sum(ch["deletions"] for ch in staged_changes)
+        staged_additions, staged_deletions = change_totals(staged_changes)
         staged_table = get_diff_summary_table(staged_changes, "green")
         staged_panel = Panel(
             Padding(staged_table,(1,2)),
@@ -680,28 +741,82 @@ def display_status(
             width=50,
             expand=True
         )
-        console.print(staged_panel)
+        renderables.append(staged_panel)
     elif staged:
-        console.print("[dim]No staged changes[/dim]")
-
-def get_status() -> Tuple[str, str, List[Dict[str, Any]], List[Dict[str, Any]]]:
+        renderables.append("[dim]No staged changes[/dim]")
+
+    return renderables
+
+# Short-lived cache so back-to-back status reads (menu render, prompt) share one git run.
+# One (ts, cwd, status, key) tuple, replaced whole, so the worker thread and the
+# main loop never read a status paired with another fetch's fingerprints.
+STATUS_CACHE_TTL = 0.5
+_status_cache: Dict[str, Any] = {"entry": None}
+
+def changes_fingerprint(changes: List[Dict[str, Any]]) -> Tuple[Tuple[str, int, int], ...]:
+    """Hashable summary of parsed changes: (file, additions, deletions) per entry."""
+    return tuple((ch.get('file', ''), ch.get('additions', 0), ch.get('deletions', 0)) for ch in changes)
+
+def invalidate_status_cache():
+    """Drop the cached get_status() result after anything that changes git state."""
+    _status_cache["entry"] = None
+
+_status_executor = None
+
+def _get_status_executor():
+    """Single long-lived worker thread that runs the unstaged diff alongside the staged one."""
+    global _status_executor
+    if _status_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _status_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gitsmart-status")
+    return _status_executor
+
+def shutdown_status_executor():
+    """Wait for any in-flight diff and stop the status worker thread."""
+    global _status_executor
+    if _status_executor is not None:
+        _status_executor.shutdown(wait=True)
+        _status_executor = None
+
+def get_status_and_key() -> Tuple[Tuple[str, str, List[Dict[str, Any]], List[Dict[str, Any]]],
+                                  Tuple[Tuple[Tuple[str, int, int], ...], Tuple[Tuple[str, int, int], ...]]]:
     """
-    Return diffs for staged and unstaged changes, plus parse them into lists.
+    Return (status, key): the get_status() tuple and the (staged, unstaged)
+    change fingerprints computed from that same fetch, so callers can key
+    caches on it without rebuilding it or reading it separately.
+    Both git diffs run concurrently; the caller only waits for the slower one.
+    Results are reused for STATUS_CACHE_TTL seconds.
     """
+    cwd = os.getcwd()
+    now = time.monotonic()
+    entry = _status_cache["entry"]
+    if entry is not None and entry[1] == cwd and now - entry[0] < STATUS_CACHE_TTL:
+        return entry[2], entry[3]
+
+    unstaged_future = _get_status_executor().submit(get_git_diff, False)
     diff = get_git_diff(staged=True)
-    unstaged_diff = get_git_diff(staged=False)
+    unstaged_diff = unstaged_future.result()
     staged_changes = parse_diff(diff)
     unstaged_changes = parse_diff(unstaged_diff)
-    return diff, unstaged_diff, staged_changes, unstaged_changes
+    result = (diff, unstaged_diff, staged_changes, unstaged_changes)
+    key = (changes_fingerprint(staged_changes), changes_fingerprint(unstaged_changes))
+    _status_cache["entry"] = (now, cwd, result, key)
+    return result, key
+
+def get_status() -> Tuple[str, str, List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Return diffs for staged and unstaged changes, plus parse them into lists.
+    """
+    return get_status_and_key()[0]
 
 def get_and_display_status():
     """
     Always show both Unstaged Changes and Staged Changes panels,
     returning the raw diffs + parsed lists for further operations.
     """
-    diff, unstaged_diff, staged_changes, unstaged_changes = get_status()
+    (diff, unstaged_diff, staged_changes, unstaged_changes), key = get_status_and_key()
     # Force staged=True, unstaged=True so both panels appear every time
-    display_status(unstaged_changes, staged_changes, staged=True, unstaged=True)
+    display_status(unstaged_changes, staged_changes, staged=True, unstaged=True, key=key)
     return diff, unstaged_diff, staged_changes, unstaged_changes
 
 def select_model():
@@ -749,7 +864,8 @@ def reset_console():
     Clears the console thoroughly for cross-platform usage.
     """
     console.clear()
-    print("\n" * 25)
+    # Through the console so it joins a buffered frame when called inside one
+    console.print("\n" * 25)
 
 def load_gitignore() -> List[str]:
     """
@@ -827,6 +943,8 @@ def handle_ignore_files():
     import questionary
     import os
 
+    invalidate_status_cache()
+
     ignored_files = load_gitignore()
     all_files = get_tracked_files()
 
@@ -889,6 +1007,8 @@ def get_tracked_files() -> List[str]:
 def handle_push_repo() -> List[str]:
     import questionary
 
+    invalidate_status_cache()
+
     # Get remotes
     remotes = get_git_remotes()
     if not remotes:
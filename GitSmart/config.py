@@ -13,6 +13,8 @@ config.read(CONFIG_PATH)
 # Directory for persistent storage
 history_dir = os.path.join(get_git_root(), ".gitsmart")
 MODEL_CACHE = Cache(os.path.join(history_dir, "model_cache"))
+# Token counts of the fixed prompt texts, keyed by content digest
+TOKEN_COUNT_CACHE = Cache(os.path.join(history_dir, "token_counts"))
 # Load configurations
 AUTH_TOKEN = config["API"]["auth_token"]
 API_URL = config["API"]["api_url"]
@@ -23,9 +25,13 @@ DEFAULT_MODEL = config["API"]["model"]
 MAX_TOKENS = int(config["API"]["max_tokens"])
 TEMPERATURE = float(config["API"]["temperature"])
 USE_EMOJIS = config["PROMPTING"]["use_emojis"].lower() == "true"
+# Mark the system prompt with cache_control blocks; only for providers that accept them
+PROMPT_CACHING = config.get("PROMPTING", "prompt_caching", fallback="false").lower() == "true"
 DEBUG = config["APP"]["debug"].lower() == "true"
 AUTO_REFRESH = config["APP"]["auto_refresh"].lower() == "true"
 AUTO_REFRESH_INTERVAL = int(config["APP"]["auto_refresh_interval"])
+# Watch the filesystem instead of polling when watchdog is installed
+AUTO_REFRESH_WATCH = config.get("APP", "auto_refresh_watch", fallback="true").lower() == "true"
 TOKEN_INCREMENT = 3000
 
 # MCP Server Configuration
@@ -0,0 +1,168 @@
+import os
+import subprocess
+import threading
+from typing import Callable, List, Optional, Set
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+    class FileSystemEventHandler:
+        pass
+
+from .config import logger, DEBUG
+
+"""
+fs_watcher.py
+
+Filesystem watching for auto-refresh. Instead of polling git on a fixed
+interval, watch the worktree plus .git/index, .git/HEAD and .git/refs and
+only wake the refresh worker when something relevant actually changed.
+Requires the optional `watchdog` package; callers fall back to polling
+when it isn't installed.
+"""
+
+
+# Read-only accesses (watchdog's inotify backend reports these). Every git
+# command opens .git/HEAD and .git/index, including the ones the refresh itself
+# runs, so counting them would wake the worker in a loop while idle.
+_READ_ONLY_EVENTS = frozenset(("opened", "closed_no_write"))
+
+
+class _RepoEventHandler(FileSystemEventHandler):
+    """Forwards the paths of filesystem writes to the owning RepoWatcher."""
+
+    def __init__(self, watcher: "RepoWatcher"):
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type in _READ_ONLY_EVENTS:
+            return
+        self.watcher._record(event.src_path)
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            self.watcher._record(dest_path)
+
+
+class RepoWatcher:
+    """
+    Watch a repository and call `on_change` (debounced) when tracked state may
+    have changed. Paths ignored by .gitignore are filtered out in one batched
+    `git check-ignore --stdin` call per burst so build churn doesn't wake the UI.
+    """
+
+    def __init__(self, repo_root: str, git_dir: str, on_change: Callable[[], None], debounce: float = 1.0):
+        self.repo_root = os.path.realpath(repo_root)
+        self.git_dir = os.path.realpath(git_dir)
+        self.on_change = on_change
+        self.debounce = debounce
+        self._skip_dirs = (
+            os.path.join(self.repo_root, ".gitsmart") + os.sep,
+        )
+        self._pending: Set[str] = set()
+        self._git_event = False
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._observer = None
+
+    def start(self) -> bool:
+        """Start watching. Returns False when watchdog is unavailable or fails to start."""
+        if not WATCHDOG_AVAILABLE:
+            return False
+        try:
+            handler = _RepoEventHandler(self)
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(handler, self.repo_root, recursive=True)
+            if not self.git_dir.startswith(self.repo_root + os.sep):
+                # Linked worktrees and separate git dirs live outside the tree
+                observer.schedule(handler, self.git_dir, recursive=True)
+            observer.start()
+        except Exception as e:
+            if DEBUG:
+                logger.error(f"Filesystem watcher failed to start: {e}")
+            return False
+        self._observer = observer
+        if DEBUG:
+            logger.debug(f"Filesystem watcher started on {self.repo_root}")
+        return True
+
+    def stop(self):
+        """Stop watching and cancel any pending debounce timer."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+        if self._observer:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2)
+            except Exception as e:
+                if DEBUG:
+                    logger.error(f"Error stopping filesystem watcher: {e}")
+            self._observer = None
+
+    def _classify(self, path: str) -> Optional[str]:
+        """Return 'git' for relevant .git paths, 'tree' for worktree paths, None to drop."""
+        path = os.path.realpath(path)
+        if path == self.git_dir or path.startswith(self.git_dir + os.sep):
+            rel = os.path.relpath(path, self.git_dir)
+            if rel.endswith(".lock"):
+                return None
+            if rel in ("index", "HEAD") or rel == "refs" or rel.startswith("refs" + os.sep):
+                return "git"
+            return None
+        if path.startswith(self._skip_dirs) or not path.startswith(self.repo_root + os.sep):
+            return None
+        return "tree"
+
+    def _record(self, path: str):
+        kind = self._classify(path)
+        if kind is None:
+            return
+        with self._lock:
+            if kind == "git":
+                self._git_event = True
+            else:
+                self._pending.add(os.path.relpath(os.path.realpath(path), self.repo_root))
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush(self):
+        with self._lock:
+            paths = list(self._pending)
+            git_event = self._git_event
+            self._pending.clear()
+            self._git_event = False
+            self._timer = None
+        if git_event or self._any_not_ignored(paths):
+            try:
+                self.on_change()
+            except Exception as e:
+                if DEBUG:
+                    logger.error(f"Filesystem watcher callback failed: {e}")
+
+    def _any_not_ignored(self, paths: List[str]) -> bool:
+        """True if at least one path is not matched by the repo's ignore rules."""
+        if not paths:
+            return False
+        try:
+            result = subprocess.run(
+                ["git", "check-ignore", "--stdin", "-z"],
+                input=b"\x00".join(os.fsencode(p) for p in paths),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.repo_root
+            )
+        except (OSError, subprocess.SubprocessError):
+            return True
+        # Exit code 1 means none of the paths are ignored
+        if result.returncode != 0:
+            return True
+        ignored = {os.fsdecode(p) for p in result.stdout.split(b"\x00") if p}
+        return any(p not in ignored for p in paths)
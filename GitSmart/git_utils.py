@@ -1,24 +1,34 @@
 import os
 import re
+import stat
+import struct
+import hashlib
 import subprocess
-from typing import List, Dict, Any, Optional
+import sys
+from typing import List, Dict, Any, Optional, Tuple
 from math import floor, ceil
 
 from .ui import console, printer
 from .config import logger, DEBUG
 
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
 """
 This module houses all Git-related operations such as fetching diffs,
 staging, unstaging, commit history, etc.
 """
 
 
-def run_git_command(command: List[str]) -> str:
+def run_git_command(command: List[str], cwd: Optional[str] = None) -> str:
     """
-    Run a git command and return the result or an error message.
+    Run a git command (in `cwd`, default the current directory) and return the result or an error message.
     """
     try:
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, cwd=cwd)
         return f"Success: {' '.join(command)}"
     except subprocess.CalledProcessError as e:
         error_message = f"Error: {' '.join(command)}. Error: {e}"
@@ -36,14 +46,304 @@ def run_git_command(command: List[str]) -> str:
             logger.error(error_message)
         return error_message
 
-def get_git_diff(staged: bool = True) -> str:
+_rev_parse_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
+def _cached_rev_parse(flag: str, cwd: Optional[str] = None) -> Optional[str]:
+    """
+    Run `git rev-parse <flag>` once per working directory and cache the answer.
+    """
+    key = (cwd or os.getcwd(), flag)
+    if key not in _rev_parse_cache:
+        try:
+            value = subprocess.check_output(
+                ["git", "rev-parse", flag],
+                universal_newlines=True,
+                stderr=subprocess.DEVNULL,
+                cwd=cwd
+            ).strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            value = None
+        _rev_parse_cache[key] = value
+    return _rev_parse_cache[key]
+
+def get_git_dir() -> Optional[str]:
+    """
+    Return the absolute .git directory for the current working directory.
+    """
+    return _cached_rev_parse("--absolute-git-dir")
+
+def get_repo_root(cwd: Optional[str] = None) -> Optional[str]:
+    """
+    Return the top-level worktree directory for `cwd` (default the current working directory).
+    """
+    return _cached_rev_parse("--show-toplevel", cwd)
+
+def get_index_fingerprint() -> Optional[Tuple[int, int, str, int]]:
+    """
+    Cheap fingerprint of the repository state that doesn't spawn git:
+    (index mtime, index size, HEAD contents, mtime of the ref HEAD points to).
+    Returns None if the index can't be stat'ed (e.g. a fresh repo).
+    """
+    git_dir = get_git_dir()
+    if not git_dir:
+        return None
+    try:
+        index_stat = os.stat(os.path.join(git_dir, "index"))
+        with open(os.path.join(git_dir, "HEAD"), "r") as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+
+    ref_mtime = 0
+    if head.startswith("ref: "):
+        try:
+            ref_mtime = os.stat(os.path.join(git_dir, head[5:])).st_mtime_ns
+        except OSError:
+            # Ref is packed or not created yet (unborn branch)
+            pass
+    return (index_stat.st_mtime_ns, index_stat.st_size, head, ref_mtime)
+
+_tracked_files_cache: Dict[str, Any] = {"key": None, "files": []}
+
+def get_worktree_fingerprint() -> Optional[Tuple[Tuple[int, int, str, int], int]]:
+    """
+    Fingerprint the index plus the stat info of every tracked file, without
+    running git status. The tracked file list only changes when the index
+    does, so `git ls-files` is re-run only when the index fingerprint moves.
+    Returns None when there is no index yet (fresh repo).
+    """
+    index_fp = get_index_fingerprint()
+    root = get_repo_root()
+    if index_fp is None or not root:
+        return None
+
+    key = (root, index_fp)
+    if _tracked_files_cache["key"] != key:
+        try:
+            out = subprocess.check_output(["git", "ls-files", "-z"], cwd=root, stderr=subprocess.DEVNULL)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        _tracked_files_cache["key"] = key
+        _tracked_files_cache["files"] = [os.path.join(root, os.fsdecode(p)) for p in out.split(b"\x00") if p]
+
+    stats = []
+    for path in _tracked_files_cache["files"]:
+        try:
+            st = os.stat(path)
+            stats.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stats.append((0, 0))
+    return (index_fp, hash(tuple(stats)))
+
+_status_flags: Optional[List[str]] = None
+
+def get_status_config_flags() -> List[str]:
+    """
+    `-c` overrides that let `git status` skip the full worktree scan: the
+    untracked cache everywhere, and the builtin FSMonitor daemon on platforms
+    that ship it (macOS/Windows, git >= 2.36). Passed per call so the user's
+    git config is never modified. The index still is: like any `git status`,
+    the call may take index.lock to write back refreshed stat info and the
+    untracked cache extension, which is where the cache persists between
+    polls. Computed once per process.
+    """
+    global _status_flags
+    if _status_flags is None:
+        flags = ["-c", "core.untrackedCache=true"]
+        try:
+            version = subprocess.check_output(["git", "--version"], universal_newlines=True)
+            match = re.search(r"(\d+)\.(\d+)", version)
+            if match and (int(match.group(1)), int(match.group(2))) >= (2, 36) \
+                    and sys.platform in ("darwin", "win32"):
+                flags = ["-c", "core.fsmonitor=true"] + flags
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            pass
+        _status_flags = flags
+    return _status_flags
+
+_pygit2_repos: Dict[str, Any] = {}
+
+def get_pygit2_repo(root: Optional[str] = None):
+    """
+    Return a cached pygit2.Repository for `root` (default: current repo root),
+    or None when pygit2 isn't installed or the path can't be opened.
+    """
+    if not PYGIT2_AVAILABLE:
+        return None
+    root = root or get_repo_root()
+    if not root:
+        return None
+    repo = _pygit2_repos.get(root)
+    if repo is None:
+        try:
+            repo = pygit2.Repository(root)
+        except Exception as e:
+            if DEBUG:
+                logger.error(f"pygit2 could not open {root}: {e}")
+            return None
+        _pygit2_repos[root] = repo
+    return repo
+
+def _cleanup_commit_message(message: str) -> str:
+    """Mirror `git commit --cleanup=whitespace`, the default for -m messages."""
+    lines = [line.rstrip() for line in message.splitlines()]
+    cleaned = []
+    for line in lines:
+        if line or (cleaned and cleaned[-1]):
+            cleaned.append(line)
+    while cleaned and not cleaned[-1]:
+        cleaned.pop()
+    return "\n".join(cleaned) + "\n" if cleaned else ""
+
+def _env_signature(repo, role: str):
+    """
+    Signature for `role` ("AUTHOR" or "COMMITTER") from GIT_<role>_NAME /
+    GIT_<role>_EMAIL, falling back to user.name / user.email. Returns None,
+    so the caller defers to git, for what this doesn't resolve like git does:
+    a GIT_<role>_DATE (git accepts date formats libgit2 can't parse) or the
+    <role>.name / <role>.email config keys, which git prefers over user.*.
+    """
+    if os.environ.get(f"GIT_{role}_DATE"):
+        return None
+    section = role.lower()
+    if f"{section}.name" in repo.config or f"{section}.email" in repo.config:
+        return None
+    name = os.environ.get(f"GIT_{role}_NAME")
+    email = os.environ.get(f"GIT_{role}_EMAIL")
+    if not (name and email):
+        default = repo.default_signature
+        name = name or default.name
+        email = email or default.email
+    return pygit2.Signature(name, email)
+
+def commit_in_process(message: str, root: Optional[str] = None) -> bool:
+    """
+    Commit the index with libgit2, skipping the git fork/exec. Returns False
+    without touching anything whenever `git commit` could behave differently
+    (hooks, signing, a merge in progress, nothing staged, no identity, a
+    GIT_*_DATE override, author.*/committer.* config), so the caller falls
+    back to running git.
+    """
+    repo = get_pygit2_repo(root)
+    if repo is None:
+        return False
+    try:
+        # state() is 0 (GIT_REPOSITORY_STATE_NONE) unless a merge/rebase/etc. is in progress
+        if repo.is_bare or repo.state() != 0:
+            return False
+        if "commit.gpgsign" in repo.config and repo.config.get_bool("commit.gpgsign"):
+            return False
+        hooks_dir = repo.config["core.hooksPath"] if "core.hooksPath" in repo.config \
+            else os.path.join(repo.path, "hooks")
+        hooks_dir = os.path.join(repo.workdir, os.path.expanduser(hooks_dir))
+        for hook in ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit"):
+            if os.path.exists(os.path.join(hooks_dir, hook)):
+                return False
+        message = _cleanup_commit_message(message)
+        if not message:
+            return False
+
+        author = _env_signature(repo, "AUTHOR")
+        committer = _env_signature(repo, "COMMITTER")
+        if author is None or committer is None:
+            return False
+        repo.index.read()
+        tree = repo.index.write_tree()
+        if repo.head_is_unborn:
+            parents = []
+        else:
+            head = repo.head.peel(pygit2.Commit)
+            if head.tree_id == tree:
+                # Nothing staged: let git report it
+                return False
+            parents = [head.id]
+        repo.create_commit("HEAD", author, committer, message, tree, parents)
+        return True
+    except Exception as e:
+        if DEBUG:
+            logger.error(f"In-process commit failed, falling back to git: {e}")
+        return False
+
+def get_status_raw() -> Optional[bytes]:
+    """
+    Raw `git status --porcelain=v2 -z` output, unparsed. Returns None on failure.
+    """
+    try:
+        return subprocess.check_output(
+            ["git", *get_status_config_flags(), "status", "--porcelain=v2", "-z", "--untracked-files=normal"],
+            stderr=subprocess.DEVNULL
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        if DEBUG:
+            logger.error(f"Error getting porcelain status: {e}")
+        return None
+
+def _stat_bytes(path: str) -> bytes:
+    """Packed (mtime_ns, size) for hashing; zeros if the file is gone."""
+    try:
+        st = os.stat(path)
+        return struct.pack("<qq", st.st_mtime_ns, st.st_size)
+    except OSError:
+        return b"\x00" * 16
+
+def get_status_digest() -> Optional[bytes]:
+    """
+    8-byte blake2b digest of the working tree state: every changed or
+    untracked (not ignored) path with its status and (mtime_ns, size), so a
+    repeat edit of an already-modified file changes it too. Change detection
+    then compares two short byte strings. Uses libgit2 in-process when pygit2
+    is installed, otherwise one porcelain v2 call. Returns None on failure.
+    """
+    root = get_repo_root() or ""
+    h = hashlib.blake2b(digest_size=8)
+    repo = get_pygit2_repo(root) if root else None
+    if repo is not None:
+        try:
+            for path, flags in repo.status().items():
+                if flags & pygit2.GIT_STATUS_IGNORED:
+                    continue
+                h.update(path.encode("utf-8", "surrogateescape"))
+                h.update(struct.pack("<I", flags))
+                h.update(_stat_bytes(os.path.join(root, path)))
+            return h.digest()
+        except Exception as e:
+            if DEBUG:
+                logger.error(f"pygit2 status failed, falling back to git: {e}")
+            h = hashlib.blake2b(digest_size=8)
+
+    buf = get_status_raw()
+    if buf is None:
+        return None
+    # The raw records already carry paths and status codes; only the stat info is added
+    h.update(buf)
+    records = buf.split(b'\x00')
+    i = 0
+    while i < len(records):
+        rec = records[i]
+        i += 1
+        kind = rec[:1]
+        if kind == b'1':
+            path = rec.split(b' ', 8)[-1]
+        elif kind == b'2':
+            path = rec.split(b' ', 9)[-1]
+            i += 1
+        elif kind == b'u':
+            path = rec.split(b' ', 10)[-1]
+        elif kind == b'?':
+            path = rec[2:]
+        else:
+            continue
+        h.update(_stat_bytes(os.path.join(os.fsencode(root), path)))
+    return h.digest()
+
+def get_git_diff(staged: bool = True, cwd: Optional[str] = None) -> str:
     """
     Get the git diff of staged or unstaged changes.
     """
     logger.debug(f"Entering get_git_diff function. Staged: {staged}")
     try:
         cmd = ["git", "diff", "--staged"] if staged else ["git", "diff"]
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, check=True)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, check=True, cwd=cwd)
         diff = result.stdout.decode("utf-8")
         logger.debug("Git diff retrieved successfully.")
         return diff
@@ -84,6 +384,53 @@ def parse_diff(diff: str) -> List[Dict[str, Any]]:
 
     return file_changes
 
+def get_diff_numstat(staged: bool = True, cwd: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Per-file additions and deletions for staged or unstaged changes, in the
+    same shape as parse_diff(), from `git diff --numstat` instead of the full
+    patch text. Binary files count as zero lines.
+    """
+    cmd = ["git", "diff", "--numstat", "-z"]
+    if staged:
+        cmd.insert(2, "--staged")
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, check=True, cwd=cwd)
+    except subprocess.CalledProcessError as e:
+        if DEBUG:
+            logger.error(f"Failed to get {'staged' if staged else 'unstaged'} numstat: {e}")
+        return []
+
+    file_changes = []
+    records = result.stdout.decode("utf-8", "surrogateescape").split("\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+        added, deleted, path = record.split("\t", 2)
+        if not path:
+            # Renames and copies carry "<old>\0<new>" after an empty path field
+            path = records[i + 1]
+            i += 2
+        file_changes.append({
+            "file": path,
+            "additions": int(added) if added != "-" else 0,
+            "deletions": int(deleted) if deleted != "-" else 0,
+        })
+    return file_changes
+
+def change_totals(*change_lists: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    (additions, deletions) summed over one or more parsed change lists in a single pass.
+    """
+    additions = deletions = 0
+    for changes in change_lists:
+        for change in changes:
+            additions += change["additions"]
+            deletions += change["deletions"]
+    return additions, deletions
+
 def get_file_diff(file: str, staged: bool = True) -> List[str]:
     """
     Retrieve the git diff for a specific file, either staged or unstaged.
@@ -99,35 +446,129 @@ def get_file_diff(file: str, staged: bool = True) -> List[str]:
         console.print(f"[bold red]Failed to get diff for {file}: {e}[/bold red]")
         return []
 
-def stage_files(files: List[str]) -> str:
+def stage_files(files: List[str], cwd: Optional[str] = None) -> str:
     """
     Stage the specified files.
     """
-    return run_git_command(["git", "add"] + files)
+    return run_git_command(["git", "add"] + files, cwd=cwd)
 
-def unstage_files(files: List[str]) -> str:
+def unstage_files(files: List[str], cwd: Optional[str] = None) -> str:
     """
     Unstage the specified files.
     """
-    return run_git_command(["git", "reset"] + files)
+    return run_git_command(["git", "reset"] + files, cwd=cwd)
 
-def add_files(files: List[str]) -> str:
+def _tracked_in_index(repo, full_paths: List[str], is_dir: List[bool]) -> Optional[List[bool]]:
+    """
+    Look `full_paths` up in the repository index in-process. Returns None when
+    there's no pygit2 handle or a path can't be mapped into the worktree, so the
+    caller asks git instead.
+    """
+    if repo is None or repo.workdir is None:
+        return None
+    try:
+        index = repo.index
+        index.read(False)  # reloads only if the index file changed
+        workdir = repo.workdir
+        entries = None
+        hits = []
+        for full_path, path_is_dir in zip(full_paths, is_dir):
+            rel = os.path.relpath(full_path, workdir)
+            if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+                return None
+            rel = rel.replace(os.sep, "/")
+            if path_is_dir:
+                # A directory counts as tracked if anything under it is
+                if entries is None:
+                    entries = [entry.path for entry in index]
+                prefix = "" if rel == "." else rel + "/"
+                hits.append(any(e.startswith(prefix) for e in entries))
+            else:
+                hits.append(rel in index)
+        return hits
+    except Exception as e:
+        if DEBUG:
+            logger.error(f"pygit2 index lookup failed, falling back to git: {e}")
+        return None
+
+def split_add_candidates(paths: List[str], cwd: Optional[str] = None) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Split paths given to an add command into (missing, already_tracked, untracked).
+    Each path is stat'ed once, for both existence and whether it's a directory,
+    and the tracked check is one lookup for all of them.
+    """
+    base = cwd or os.getcwd()
+    missing = []
+    existing = []
+    is_dir = []
+    for path in paths:
+        try:
+            st = os.stat(os.path.join(base, path))
+        except OSError:
+            missing.append(path)
+            continue
+        existing.append(path)
+        is_dir.append(stat.S_ISDIR(st.st_mode))
+    already_tracked, untracked = _partition_tracked(existing, cwd, is_dir)
+    return missing, already_tracked, untracked
+
+def _partition_tracked(paths: List[str], cwd: Optional[str], is_dir: List[bool]) -> Tuple[List[str], List[str]]:
+    """
+    Split existing paths into (already_tracked, untracked) with a single index
+    lookup. A directory counts as tracked if anything under it is. Relative
+    paths are resolved against `cwd` (default the current directory). If git
+    fails, every path is treated as untracked.
+    """
+    if not paths:
+        return [], []
+    base = cwd or os.getcwd()
+    root = get_repo_root(cwd)
+    in_index = _tracked_in_index(
+        get_pygit2_repo(root) if root else None, [os.path.join(base, p) for p in paths], is_dir
+    )
+    if in_index is not None:
+        return (
+            [p for p, hit in zip(paths, in_index) if hit],
+            [p for p, hit in zip(paths, in_index) if not hit],
+        )
+
+    tracked = set()
+    result = subprocess.run(
+        ["git", "ls-files", "-z", "--"] + list(paths),
+        capture_output=True, check=False, cwd=cwd
+    )
+    if result.returncode == 0:
+        # ls-files prints paths relative to the directory it ran in
+        tracked = {os.path.normpath(os.fsdecode(p)) for p in result.stdout.split(b"\0") if p}
+
+    already_tracked = []
+    untracked = []
+    for path, path_is_dir in zip(paths, is_dir):
+        norm_path = os.path.normpath(os.path.relpath(os.path.join(base, path), base))
+        if norm_path in tracked or (
+            path_is_dir and any(t.startswith(norm_path + os.sep) for t in tracked)
+        ):
+            already_tracked.append(path)
+        else:
+            untracked.append(path)
+    return already_tracked, untracked
+
+def add_files(files: List[str], cwd: Optional[str] = None) -> str:
     """
     Add untracked files to Git repository (git add).
     This is different from stage_files as it specifically handles new/untracked files.
     """
-    return run_git_command(["git", "add"] + files)
+    return run_git_command(["git", "add"] + files, cwd=cwd)
 
 def get_repo_name() -> str:
     """
     Retrieve the current repository's name by reading top-level directory.
     """
-    try:
-        repo_path = subprocess.check_output(["git", "rev-parse", "--show-toplevel"], universal_newlines=True).strip()
-        repo_name = os.path.basename(repo_path)
-        return repo_name
-    except subprocess.CalledProcessError:
+    # Cached per working directory, so menu rebuilds don't fork git for it
+    repo_path = get_repo_root()
+    if not repo_path:
         return "Unknown Repository"
+    return os.path.basename(repo_path)
 
 def get_git_remotes() -> Dict[str, str]:
     """
@@ -158,12 +599,39 @@ def get_current_branch() -> Optional[str]:
     Returns:
         Current branch name or None if not on any branch
     """
+    return get_repo_branch()
+
+def get_repo_branch(cwd: Optional[str] = None) -> Optional[str]:
+    """
+    Get the branch checked out in the repository at `cwd`.
+
+    Args:
+        cwd: Repository to inspect (default: current directory)
+
+    Returns:
+        Branch name or None if not on any branch
+    """
+    # Read HEAD in-process when pygit2 is available; no git spawn needed
+    repo = get_pygit2_repo(cwd) if PYGIT2_AVAILABLE else None
+    if repo is not None:
+        try:
+            target = repo.lookup_reference("HEAD").target
+        except Exception as e:
+            if DEBUG:
+                logger.error(f"pygit2 could not read HEAD: {e}")
+        else:
+            # A detached HEAD targets a commit id rather than a branch ref
+            if isinstance(target, str) and target.startswith("refs/heads/"):
+                return target[len("refs/heads/"):]
+            return None
+
     try:
         result = subprocess.run(
             ["git", "branch", "--show-current"],
             stdout=subprocess.PIPE,
             check=True,
-            text=True
+            text=True,
+            cwd=cwd
         )
         current_branch = result.stdout.strip()
         logger.debug(f"Current branch: {current_branch}")
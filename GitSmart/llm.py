@@ -3,8 +3,18 @@ import requests
 import signal
 from typing import List, Dict, Optional, Callable
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from .config import AUTH_TOKEN, API_URL
 
+# Shared pool: repeat calls (and concurrent MCP tool calls running in executor
+# threads) reuse open connections instead of a TCP/TLS handshake per request
+_session = requests.Session()
+
 def get_chat_completion(
     model: str,
     messages: List[Dict[str, str]],
@@ -32,7 +42,7 @@ def get_chat_completion(
             "stream": stream
         }
         try:
-            response = requests.post(API_URL, headers=headers, json=body, stream=stream, timeout=timeout)
+            response = _session.post(API_URL, headers=headers, json=body, stream=stream, timeout=timeout)
             response.raise_for_status()
             result = ""
             
@@ -40,16 +50,18 @@ def get_chat_completion(
                 # Check for interruption signals
                 try:
                     if chunk:
-                        chunk_data = chunk.decode("utf-8").strip()
-                        if chunk_data.startswith("data: "):
+                        # Both json and orjson accept bytes, so skip the str decode per chunk
+                        chunk_data = chunk.strip()
+                        if chunk_data.startswith(b"data: "):
                             chunk_data = chunk_data[6:]
                             try:
-                                data = json.loads(chunk_data)
+                                data = _json_loads(chunk_data)
                                 delta_content = data["choices"][0]["delta"].get("content", "")
                                 result += delta_content
                                 if status_callback is not None:
                                     status_callback(result)
-                            except json.JSONDecodeError:
+                            except ValueError:
+                                # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
                                 continue
                 except KeyboardInterrupt:
                     # Gracefully handle interruption during streaming
@@ -4,15 +4,20 @@ import argparse
 import sys
 import time
 import threading
-import signal
 import os
+import queue
+import selectors
+import socket
 
 
-from .config import logger, MODEL, DEBUG, MODEL_CACHE, AUTO_REFRESH, AUTO_REFRESH_INTERVAL, MCP_ENABLED, MCP_HOST, MCP_PORT
+from .config import logger, MODEL, DEBUG, AUTO_REFRESH, AUTO_REFRESH_INTERVAL, AUTO_REFRESH_WATCH, MCP_ENABLED, MCP_HOST, MCP_PORT
 from .ui import console, printer, Console
 from .cli_flow import (
-    get_and_display_status,
     get_status,
+    get_status_and_key,
+    display_status,
+    invalidate_status_cache,
+    shutdown_status_executor,
     handle_generate_commit,
     handle_review_changes,
     display_commit_summary,
@@ -30,6 +35,8 @@ from .cli_flow import (
     MenuNavigationException
 )
 from .utils import chdir_to_git_root
+from .git_utils import get_index_fingerprint, get_worktree_fingerprint, get_status_digest, get_repo_root, get_git_dir
+from .fs_watcher import RepoWatcher, WATCHDOG_AVAILABLE
 from .repo_registry import get_repository_registry, ensure_repository_context
 from .repo_manager import get_repo_manager, register_current_repo
 
@@ -47,7 +54,7 @@ class DummyMCPState:
 
 if MCP_ENABLED:
     try:
-        from .mcp_server import mcp, start_mcp_server, is_server_running, get_mcp_state
+        from .mcp_server import start_mcp_server, is_server_running, get_mcp_state
     except ImportError:
         logger.warning("MCP server module could not be imported, MCP functionality disabled")
         MCP_ENABLED = False
@@ -55,14 +62,38 @@ if MCP_ENABLED:
 else:
     get_mcp_state = lambda: DummyMCPState()
 
+# Synchronized output (DEC private mode 2026): the terminal holds the frame and
+# presents it in one go. Terminals without support ignore the sequence.
+SYNC_START = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+
+def _backoff_interval(base: int, idle_ticks: int) -> int:
+    """Polling interval after `idle_ticks` consecutive checks found no changes."""
+    if idle_ticks < 3:
+        return base
+    if idle_ticks < 6:
+        return max(base, 10)
+    if idle_ticks < 11:
+        return max(base, 30)
+    return max(base, 60)
+
+
 """
 main.py
 
 - Orchestrates the main application loop
-- Always uses get_and_display_status() to show both staged/unstaged
+- Always shows both staged/unstaged panels via display_status()
 - Passes dynamic menu from get_menu_options() to main_menu_prompt
 """
-def main(reload: bool = False):
+def main(reload: bool = False, banner: bool = True):
+    global AUTO_REFRESH, AUTO_REFRESH_INTERVAL
+
+    # --reload is served by the regular auto-refresh worker rather than a
+    # second polling thread, so only one git status check runs per tick
+    if reload:
+        AUTO_REFRESH = True
+        AUTO_REFRESH_INTERVAL = min(AUTO_REFRESH_INTERVAL, 5)
+
     # Initialize repository context
     repo_registry = get_repository_registry()
     repo_manager = get_repo_manager()
@@ -88,15 +119,40 @@ def main(reload: bool = False):
             console.print("[bold cyan]# GitSmart[/bold cyan]")
             console.print("[bold yellow]⚠️  No Git repository found. Some features may be limited.[/bold yellow]")
 
-    display_commit_summary(3)
+    warmup_thread = None
+    if banner:
+        # Warm the status cache while the banner's git log runs, so the first
+        # menu render reuses it instead of waiting on two more git diffs
+        warmup_thread = threading.Thread(target=get_status, daemon=True)
+        warmup_thread.start()
+        display_commit_summary(3)
 
     exit_prompted = 0
     auto_refresh_active = False
     refresh_thread = None
-    last_staged_state = None
-    last_unstaged_state = None
-    state_lock = threading.Lock()
+    last_status_snapshot = None
+    # Index + tracked-file stat fingerprint from the worker's last full check
+    last_worktree_fp = None
+    # Status tuple from the last render and the index fingerprint it was taken at
+    last_status = None
+    # Change fingerprints for last_status, computed once per status fetch
+    last_status_key = None
+    last_status_fp = None
+    # (title, repo_status, choices) keyed by model, cwd and change fingerprints
+    menu_cache = {}
+    # Latest (status tuple, change fingerprints) fetched by the worker on a change;
+    # holds at most one entry, newer results replace older ones
+    latest_status_q = queue.Queue(maxsize=1)
     shutdown_requested = threading.Event()
+    # Single wakeup for the worker: set by the filesystem watcher, reset_backoff()
+    # and stop_auto_refresh(); the worker works out why from the other state
+    worker_wakeup = threading.Event()
+    repo_watcher = None
+    # Polling backs off while the repo is idle; user actions reset it
+    idle_ticks = 0
+    # Polling stops after repeated failures until the user does something
+    consecutive_failures = 0
+    circuit_tripped = threading.Event()
     mcp_server_thread = None
 
     # Start MCP server if enabled
@@ -118,136 +174,201 @@ def main(reload: bool = False):
 
     # Flag to track when menu needs refresh
     menu_needs_refresh = threading.Event()
-
-    # ─── Setup custom signal & exception for mid-prompt refresh ───────────────────
-    class RefreshMenuException(Exception):
-        """Raised to abort the questionary prompt so we can refresh the menu."""
-        pass
-
-    def _refresh_signal_handler(signum, frame):
-        # When we get SIGUSR1, raise our custom exception in the main thread
-        # But only if auto-refresh is actually active
-        if auto_refresh_active:
-            raise RefreshMenuException()
-        else:
-            # Auto-refresh is paused (e.g., during commit generation), ignore signal
-            if DEBUG:
-                logger.debug("SIGUSR1 received but auto-refresh is paused, ignoring signal")
-
-    # Register the handler BEFORE any prompt is shown
-    signal.signal(signal.SIGUSR1, _refresh_signal_handler)
-    # ────────────────────────────────────────────────────────────────────────────────
+    # True when the last refresh wakeup left the menu frame on screen untouched
+    # (the prompt erases itself), so an unchanged frame needn't be redrawn
+    menu_frame_intact = False
+    # Self-pipe the worker writes to so blocking waits wake up on a refresh
+    refresh_wakeup_r, refresh_wakeup_w = socket.socketpair()
+    refresh_wakeup_r.setblocking(False)
+    refresh_wakeup_w.setblocking(False)
 
     def check_for_changes():
-        """Check if git status has changed since last check."""
-        nonlocal last_staged_state, last_unstaged_state
+        """
+        Check if git status has changed since last check.
+        Returns None when git status couldn't be read, so the worker can count failures.
+        """
+        nonlocal last_status_snapshot, last_worktree_fp
         try:
-            _, _, current_staged, current_unstaged = get_status()
-
-            # Convert to comparable format (file paths with additions/deletions)
-            current_staged_files = {f.get('file', ''): (f.get('additions', 0), f.get('deletions', 0)) for f in current_staged}
-            current_unstaged_files = {f.get('file', ''): (f.get('additions', 0), f.get('deletions', 0)) for f in current_unstaged}
-
-            with state_lock:
-                if last_staged_state is None or last_unstaged_state is None:
-                    if DEBUG:
-                        logger.debug("Auto-refresh: Initial state setup")
-                    last_staged_state = current_staged_files
-                    last_unstaged_state = current_unstaged_files
-                    return False
+            # Nothing in the index or any tracked file moved: skip git entirely
+            worktree_fp = get_worktree_fingerprint()
+            if worktree_fp is not None and worktree_fp == last_worktree_fp and last_status_snapshot is not None:
+                return False
+
+            current_snapshot = get_status_digest()
+            if current_snapshot is None:
+                return None
+            # git status may rewrite the index (stat info, untracked cache), so re-read afterwards
+            last_worktree_fp = get_worktree_fingerprint() if worktree_fp is not None else None
+
+            # Snapshots are immutable and swapped by a single reference assignment,
+            # so no lock is needed between this thread and the main loop
+            previous_snapshot = last_status_snapshot
+            if previous_snapshot is None:
+                if DEBUG:
+                    logger.debug("Auto-refresh: Initial state setup")
+                last_status_snapshot = current_snapshot
+                return False
 
-                # Check if anything changed
-                changed = (current_staged_files != last_staged_state or
-                          current_unstaged_files != last_unstaged_state)
+            # Check if anything changed
+            changed = current_snapshot != previous_snapshot
 
-                # Temporary debug logging to see what's happening
-                if DEBUG:
-                    logger.debug(f"Auto-refresh check - Changed: {changed}")
-                if changed:
-                    logger.debug(f"Auto-refresh check - Previous staged: {last_staged_state}")
-                    logger.debug(f"Auto-refresh check - Previous unstaged: {last_unstaged_state}")
-                    logger.debug(f"Auto-refresh check - Current staged: {current_staged_files}")
-                    logger.debug(f"Auto-refresh check - Current unstaged: {current_unstaged_files}")
-                    logger.debug(f"Auto-refresh: Repository changes detected!")
-
-                if changed:
-                    last_staged_state = current_staged_files
-                    last_unstaged_state = current_unstaged_files
-
-                return changed
+            # Temporary debug logging to see what's happening
+            if DEBUG:
+                logger.debug(f"Auto-refresh check - Changed: {changed}")
+            if changed:
+                logger.debug(f"Auto-refresh check - Previous status: {previous_snapshot}")
+                logger.debug(f"Auto-refresh check - Current status: {current_snapshot}")
+                logger.debug(f"Auto-refresh: Repository changes detected!")
+                last_status_snapshot = current_snapshot
+
+            return changed
         except Exception as e:
             logger.error(f"Error checking for changes: {e}")
-            return False
+            return None
+
+    def discard_published_status():
+        """Drop a worker-fetched status that an action is about to make stale."""
+        try:
+            latest_status_q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def publish_status(item):
+        """Replace whatever is in latest_status_q with item."""
+        discard_published_status()
+        try:
+            latest_status_q.put_nowait(item)
+        except queue.Full:
+            # Only the worker publishes, so this just means the loop raced us
+            pass
 
     def auto_refresh_worker():
         """Background thread that monitors for git changes and sets refresh flag when detected."""
-        nonlocal auto_refresh_active, menu_needs_refresh
+        nonlocal auto_refresh_active, menu_needs_refresh, idle_ticks, consecutive_failures
         if DEBUG:
             logger.debug(f"Auto-refresh worker thread started (PID: {os.getpid()})")
             logger.debug(f"Initial auto_refresh_active state: {auto_refresh_active}")
             logger.debug(f"AUTO_REFRESH_INTERVAL: {AUTO_REFRESH_INTERVAL}")
 
+        # Hoisted out of the loop; none of these change while the worker runs
+        _interval = AUTO_REFRESH_INTERVAL
+        _debug = DEBUG
+        _is_shutdown = shutdown_requested.is_set
+        _watching = repo_watcher is not None
+        # --reload keeps polling at the base rate: idle ticks are answered from the
+        # index/worktree stat fingerprint, so only real changes reach git
+        _backoff = not reload
+
         try:
             loop_count = 0
-            while auto_refresh_active and not shutdown_requested.is_set():
+            while auto_refresh_active and not _is_shutdown():
                 loop_count += 1
-                if DEBUG:
-                    logger.debug(f"Auto-refresh: Loop iteration #{loop_count}, sleeping for {AUTO_REFRESH_INTERVAL}s")
-
-                # Use shutdown_requested.wait() instead of time.sleep() for interruptible sleep
-                if shutdown_requested.wait(timeout=AUTO_REFRESH_INTERVAL):
-                    # Shutdown was requested during sleep
-                    if DEBUG:
+                interval = _backoff_interval(_interval, idle_ticks) if _backoff else _interval
+                if _debug:
+                    logger.debug(f"Auto-refresh: Loop iteration #{loop_count}, sleeping for {interval}s")
+
+                # When watching, only a wakeup means there is anything to check
+                woken = worker_wakeup.wait(timeout=None if _watching else interval)
+                worker_wakeup.clear()
+                if _is_shutdown():
+                    if _debug:
                         logger.debug("Auto-refresh: Shutdown requested during sleep, exiting")
                     break
+                if woken and not _watching:
+                    # User activity: restart the wait at the base interval
+                    continue
 
-                if auto_refresh_active and not shutdown_requested.is_set():
+                if auto_refresh_active and not _is_shutdown():
                     try:
-                        if DEBUG:
+                        if _debug:
                             logger.debug("Auto-refresh: Checking for changes...")
                         # Double-check auto_refresh_active state before checking for changes
-                        if auto_refresh_active and check_for_changes():
-                            if DEBUG:
+                        changed = check_for_changes() if auto_refresh_active else False
+                        if changed is None:
+                            # A concurrent git command holding index.lock isn't a real failure
+                            git_dir = get_git_dir()
+                            if not (git_dir and os.path.exists(os.path.join(git_dir, "index.lock"))):
+                                consecutive_failures += 1
+                            if consecutive_failures >= 3:
+                                circuit_tripped.set()
+                                console.print(
+                                    "[bold yellow]⚠️  Auto-refresh paused after repeated git errors - "
+                                    "it resumes on your next menu action[/bold yellow]"
+                                )
+                                if _debug:
+                                    logger.debug("Auto-refresh: Circuit breaker tripped, stopping worker")
+                                break
+                            continue
+                        consecutive_failures = 0
+                        if changed:
+                            idle_ticks = 0
+                            if _debug:
                                 logger.debug("Auto-refresh: Repository changes detected, setting refresh flag")
+                            # Fetch the new status here so the main loop renders it
+                            # instead of running the same git diffs a second time
+                            invalidate_status_cache()
+                            publish_status(get_status_and_key())
                             # mark for refresh
                             menu_needs_refresh.set()
-                            # actually break any in-flight Questionary prompt
+                            # wake the in-flight prompt, which watches the self-pipe
                             try:
-                                # Triple-check auto_refresh_active before sending signal
-                                if auto_refresh_active and not shutdown_requested.is_set():
-                                    os.kill(os.getpid(), signal.SIGUSR1)
-                                elif DEBUG:
-                                    logger.debug("Auto-refresh: Signal not sent - auto_refresh deactivated or shutdown requested")
-                            except ProcessLookupError:
-                                # Process might be shutting down
-                                if DEBUG:
-                                    logger.debug("Auto-refresh: Could not send SIGUSR1, process may be shutting down")
+                                refresh_wakeup_w.send(b"\0")
+                            except OSError:
+                                # Pipe already has a pending wakeup
+                                pass
                         else:
-                            if DEBUG and auto_refresh_active:
+                            idle_ticks += 1
+                            if _debug and auto_refresh_active:
                                 logger.debug("Auto-refresh: No changes detected")
                     except Exception as e:
-                        if DEBUG:
+                        if _debug:
                             logger.error(f"Auto-refresh: Error during change check: {e}")
                         # Continue running even if one check fails, unless shutdown is requested
-                        if shutdown_requested.is_set():
+                        if _is_shutdown():
                             break
                 else:
-                    if DEBUG:
+                    if _debug:
                         logger.debug("Auto-refresh: auto_refresh_active is False or shutdown requested, breaking loop")
                     break
         except Exception as e:
-            if DEBUG:
+            if _debug:
                 logger.error(f"Auto-refresh worker thread crashed: {e}")
         finally:
-            if DEBUG:
+            if _debug:
                 logger.debug("Auto-refresh worker thread stopped")
 
+    def reset_backoff():
+        """Drop the polling interval back to AUTO_REFRESH_INTERVAL after user activity."""
+        nonlocal idle_ticks
+        if idle_ticks:
+            idle_ticks = 0
+            worker_wakeup.set()
+
+    def reset_circuit_breaker():
+        """Re-arm auto-refresh after the worker stopped itself on repeated failures."""
+        nonlocal consecutive_failures, refresh_thread
+        if circuit_tripped.is_set():
+            circuit_tripped.clear()
+            consecutive_failures = 0
+            if auto_refresh_active and not shutdown_requested.is_set():
+                if DEBUG:
+                    logger.debug("Auto-refresh: Re-arming after circuit breaker trip")
+                refresh_thread = threading.Thread(target=auto_refresh_worker, daemon=True)
+                refresh_thread.start()
+
     def start_auto_refresh():
         """Start the auto-refresh monitoring if enabled."""
-        nonlocal auto_refresh_active, refresh_thread
+        nonlocal auto_refresh_active, refresh_thread, repo_watcher
         if AUTO_REFRESH and not auto_refresh_active:
             if DEBUG:
                 logger.debug(f"Starting auto-refresh: enabled={AUTO_REFRESH}, interval={AUTO_REFRESH_INTERVAL}s")
+            if AUTO_REFRESH_WATCH and WATCHDOG_AVAILABLE and repo_watcher is None:
+                repo_root, git_dir = get_repo_root(), get_git_dir()
+                if repo_root and git_dir:
+                    repo_watcher = RepoWatcher(repo_root, git_dir, worker_wakeup.set)
+                    if not repo_watcher.start():
+                        # Fall back to interval polling
+                        repo_watcher = None
             auto_refresh_active = True
             refresh_thread = threading.Thread(target=auto_refresh_worker, daemon=True)
             refresh_thread.start()
@@ -259,13 +380,17 @@ def main(reload: bool = False):
 
     def stop_auto_refresh():
         """Stop the auto-refresh monitoring."""
-        nonlocal auto_refresh_active, refresh_thread
+        nonlocal auto_refresh_active, refresh_thread, repo_watcher
         if auto_refresh_active:
             if DEBUG:
                 logger.debug("STOPPING AUTO-REFRESH - Called from stop_auto_refresh()")
                 logger.debug("Stopping auto-refresh...")
             auto_refresh_active = False
             shutdown_requested.set()  # Signal shutdown to all threads
+            worker_wakeup.set()  # Wake a worker blocked on the watcher or between polls
+            if repo_watcher:
+                repo_watcher.stop()
+                repo_watcher = None
             if refresh_thread:
                 try:
                     refresh_thread.join(timeout=2)
@@ -303,8 +428,18 @@ def main(reload: bool = False):
     def main_menu_prompt_with_refresh(MODEL: str, title: str, choices: list, refresh_event: threading.Event):
         """
         Enhanced main menu prompt that can be interrupted by auto-refresh.
-        Uses a simple approach - just check for refresh before prompting.
+        The prompt watches the refresh self-pipe and returns None when the worker writes to it.
         """
+        # Drain stale wakeups first so only refreshes raised from here on count
+        try:
+            while refresh_wakeup_r.recv(64):
+                pass
+        except OSError:
+            pass
+
+        nonlocal menu_frame_intact
+        menu_frame_intact = True
+
         # Check if refresh is needed before starting prompt
         if refresh_event.is_set():
             return None  # Indicate refresh needed
@@ -316,63 +451,124 @@ def main(reload: bool = False):
             return "__MCP_OPERATION_IN_PROGRESS__"
 
         try:
-            # If we're already flagged for a refresh, bail early
-            return main_menu_prompt(MODEL, title, choices)
-        except RefreshMenuException:
-            # Our signal handler raised this in-flight → immediately rebuild menu
-            return None
+            return main_menu_prompt(MODEL, title, choices, wakeup=refresh_wakeup_r)
         except (OSError, EOFError):
             # If terminal issues, fall back to a simple text-based approach
+            menu_frame_intact = False
             console.print("[yellow]Terminal input issues detected. Using simplified menu...[/yellow]")
             for i, choice in enumerate(choices):
                 console.print(f"{i+1}. {choice}")
 
-            # For testing environments where input() blocks indefinitely,
-            # provide a timeout mechanism
-            import select
-            import sys
-
-            attempt_count = 0
-            while True:
-                if refresh_event.is_set():
-                    return None  # Refresh needed
-
-                # Check for MCP operations
-                mcp_state = get_mcp_state()
-                if mcp_state.is_operation_in_progress():
-                    return "__MCP_OPERATION_IN_PROGRESS__"
+            sel = selectors.DefaultSelector()
+            stdin_fd = None
+            try:
+                stdin_fd = sys.stdin.fileno()
+                sel.register(stdin_fd, selectors.EVENT_READ)
+                sel.register(refresh_wakeup_r, selectors.EVENT_READ)
+            except (ValueError, OSError):
+                # stdin isn't selectable here (e.g. Windows consoles), block on input()
+                sel.close()
+                sel = None
+
+            # Non-blocking stdin: partial lines are buffered here, so a refresh is
+            # never stuck behind a read that is waiting for Enter
+            was_blocking = None
+            if sel is not None:
+                was_blocking = os.get_blocking(stdin_fd)
+                os.set_blocking(stdin_fd, False)
+            buf = b""
 
-                attempt_count += 1
-                if attempt_count > 100:  # Prevent infinite loops in non-interactive environments
-                    console.print("[yellow]Non-interactive environment detected. Auto-selecting first option.[/yellow]")
-                    return choices[0] if choices else "Exit"
+            try:
+                while True:
+                    if sel is not None:
+                        console.print("Enter choice number: ", end="")
+                        while b"\n" not in buf:
+                            events = sel.select(timeout=AUTO_REFRESH_INTERVAL)
+                            if refresh_event.is_set():
+                                return None  # Refresh needed
+
+                            # Check for MCP operations
+                            mcp_state = get_mcp_state()
+                            if mcp_state.is_operation_in_progress():
+                                return "__MCP_OPERATION_IN_PROGRESS__"
 
-                try:
-                    # Check if we're in a non-interactive environment
-                    if not sys.stdin.isatty():
-                        time.sleep(0.1)  # Brief pause to allow refresh checks
-                        continue
+                            if not any(key.fd == stdin_fd for key, _ in events):
+                                continue
+                            try:
+                                chunk = os.read(stdin_fd, 1024)
+                            except BlockingIOError:
+                                continue
+                            if not chunk:
+                                # stdin closed; treat like EOF from input()
+                                raise KeyboardInterrupt()
+                            buf += chunk
+                        line, _, buf = buf.partition(b"\n")
+                        user_input = line.decode("utf-8", "replace")
+                    else:
+                        try:
+                            user_input = input("Enter choice number: ")
+                        except EOFError:
+                            raise KeyboardInterrupt()
 
-                    user_input = input("Enter choice number: ").strip()
-                    choice_num = int(user_input) - 1
+                    try:
+                        choice_num = int(user_input.strip()) - 1
+                    except ValueError:
+                        raise KeyboardInterrupt()
                     if 0 <= choice_num < len(choices):
                         return choices[choice_num]
-                    else:
-                        console.print("[red]Invalid choice. Please try again.[/red]")
-                except (ValueError, EOFError, KeyboardInterrupt):
-                    raise KeyboardInterrupt()
-                except Exception:
-                    console.print("[red]Input error. Please try again.[/red]")
+                    console.print("[red]Invalid choice. Please try again.[/red]")
+            finally:
+                if sel is not None:
+                    sel.close()
+                    os.set_blocking(stdin_fd, was_blocking)
 
     def loop():
         """Main application loop that handles user interactions."""
-        nonlocal exit_prompted, last_staged_state, last_unstaged_state, auto_refresh_active, menu_needs_refresh
-        global MODEL, MODEL_CACHE
-
-        # Load saved model from cache at startup
-        cached_model = MODEL_CACHE.get("last_model", None)
-        if cached_model:
-            MODEL = cached_model
+        nonlocal exit_prompted, auto_refresh_active, menu_needs_refresh
+        nonlocal last_status, last_status_fp, last_status_key
+        # MODEL already holds the cached last_model (read once in config); it only
+        # changes through "Select Model", which updates it and the cache together
+        global MODEL
+
+        # Screen clear + notices deferred to the next menu frame, so an action's
+        # result, the status panels and the menu go out as one render
+        frame_clear = False
+        frame_notices = []
+        # menu_key of the frame currently on screen; None once anything else drew over it
+        frame_on_screen = None
+        refresh_requested = False
+
+        def next_frame(*notices):
+            """Clear and show `notices` as part of the next menu frame instead of drawing them now."""
+            nonlocal frame_clear
+            frame_clear = True
+            frame_notices.extend(n for n in notices if n)
+
+        def render_frame(staged_changes, unstaged_changes, repo_status):
+            """
+            Draw pending notices, the status panels and the menu header. All git work is
+            done by now, so the frame is buffered and written once inside a synchronized update.
+            """
+            nonlocal frame_clear
+            sync_output = console.is_terminal
+            if sync_output:
+                console.file.write(SYNC_START)
+            try:
+                with console:
+                    if frame_clear:
+                        reset_console()
+                    for notice in frame_notices:
+                        console.print(notice)
+                    display_status(unstaged_changes, staged_changes, staged=True, unstaged=True, key=last_status_key)
+                    console.print("\n")
+                    console.print(repo_status, justify="left")
+            finally:
+                frame_clear = False
+                frame_notices.clear()
+                # Always leave synchronized mode, even if rendering failed
+                if sync_output:
+                    console.file.write(SYNC_END)
+                    console.file.flush()
 
         # Start auto-refresh if enabled
         start_auto_refresh()
@@ -384,13 +580,17 @@ def main(reload: bool = False):
                     mcp_state = get_mcp_state()
                     if mcp_state.is_operation_in_progress():
                         current_op = mcp_state.get_current_operation()
+                        frame_on_screen = None
                         console.print(f"[bold yellow]⏸️  CLI menu paused - MCP operation in progress: {current_op}[/bold yellow]")
 
                         # Wait for MCP operation to complete with timeout
                         if mcp_state.wait_for_operations_to_complete(timeout=0.5):
                             console.print("[bold green]✅ MCP operation completed - resuming CLI menu[/bold green]")
+                            last_status_fp = None
+                            discard_published_status()
+                            invalidate_status_cache()
                             time.sleep(0.5)  # Brief pause to show the message
-                            reset_console()
+                            next_frame()
                             continue
                         else:
                             # Still in progress, continue waiting
@@ -399,22 +599,49 @@ def main(reload: bool = False):
 
                     # Check if auto-refresh is requesting a menu refresh
                     if menu_needs_refresh.is_set():
-                        reset_console()
-                        console.print("[bold green]📡 Repository changes detected, refreshing menu...[/bold green]")
+                        refresh_requested = True
                         menu_needs_refresh.clear()
+                        last_status_fp = None
                         continue
 
-                    # Always refresh status before showing the menu
-                    diff, unstaged_diff, staged_changes, unstaged_changes = get_and_display_status()
-
-                    # Update the state tracking for auto-refresh with thread safety
-                    with state_lock:
-                        last_staged_state = {f.get('file', ''): (f.get('additions', 0), f.get('deletions', 0)) for f in staged_changes}
-                        last_unstaged_state = {f.get('file', ''): (f.get('additions', 0), f.get('deletions', 0)) for f in unstaged_changes}
-
-                    console.print("\n")
-                    title, repo_status, choices = get_menu_options(MODEL, staged_changes, unstaged_changes)
-                    console.print(repo_status, justify="left")
+                    try:
+                        published = latest_status_q.get_nowait()
+                    except queue.Empty:
+                        published = None
+
+                    # The index fingerprint doesn't cover worktree edits, so the cached
+                    # status is only trusted while the auto-refresh worker is watching
+                    current_fp = get_index_fingerprint() if auto_refresh_active else None
+                    if published is not None:
+                        # The worker already fetched and digested this status
+                        last_status, last_status_key = published
+                        last_status_fp = current_fp
+                    elif current_fp is None or current_fp != last_status_fp or last_status is None:
+                        last_status, last_status_key = get_status_and_key()
+                        last_status_fp = current_fp
+                        # The worker's change snapshot is left to the worker: it notices
+                        # this state on its next check and republishes it in the background,
+                        # rather than this loop running a second status scan per fetch
+                    diff, unstaged_diff, staged_changes, unstaged_changes = last_status
+
+                    menu_key = (MODEL, os.getcwd(), last_status_key)
+                    menu = menu_cache.get(menu_key)
+                    if menu is None:
+                        menu = get_menu_options(MODEL, staged_changes, unstaged_changes)
+                        if len(menu_cache) >= 2:
+                            menu_cache.clear()
+                        menu_cache[menu_key] = menu
+                    title, repo_status, choices = menu
+
+                    if refresh_requested and not frame_clear and menu_key == frame_on_screen:
+                        # The change didn't alter anything shown; keep the frame on screen
+                        refresh_requested = False
+                    else:
+                        if refresh_requested:
+                            next_frame("[bold green]📡 Repository changes detected, refreshing menu...[/bold green]")
+                            refresh_requested = False
+                        render_frame(staged_changes, unstaged_changes, repo_status)
+                        frame_on_screen = menu_key
 
                     # Present main menu with styling
                     try:
@@ -422,9 +649,12 @@ def main(reload: bool = False):
                             action = main_menu_prompt_with_refresh(MODEL, title, choices, menu_needs_refresh)
                             if action is None:
                                 # Refresh was requested, continue to top of loop
-                                reset_console()
-                                console.print("[bold green]📡 Repository changes detected, refreshing menu...[/bold green]")
+                                refresh_requested = True
+                                if not menu_frame_intact:
+                                    frame_on_screen = None
                                 menu_needs_refresh.clear()
+                                last_status_fp = None
+                                invalidate_status_cache()
                                 continue
                             elif action == "__MCP_OPERATION_IN_PROGRESS__":
                                 # MCP operation detected, continue to top of loop for waiting
@@ -444,6 +674,7 @@ def main(reload: bool = False):
 
                 except KeyboardInterrupt:
                     # Handle normal Ctrl+C from user
+                    frame_on_screen = None
                     exit_prompted += 1
                     if exit_prompted == 1:
                         reset_console()
@@ -465,7 +696,16 @@ def main(reload: bool = False):
                         continue
 
                 # Reset exit counter on successful action
+                frame_on_screen = None
                 exit_prompted = 0
+                reset_backoff()
+                reset_circuit_breaker()
+
+                # Anything that can touch the index or worktree forces a fresh status
+                if not action.startswith(("Review Changes", "View Commit History", "Select Model", "Summarize Commits")):
+                    last_status_fp = None
+                    discard_published_status()
+                    menu_cache.clear()
 
                 if action.startswith("Generate Commit for Staged Changes"):
                     reset_console()
@@ -478,8 +718,7 @@ def main(reload: bool = False):
                                 console.print(status_msg)
                         except MenuNavigationException:
                             # User pressed Ctrl-C in submenu, return to main menu
-                            reset_console()
-                            console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                            next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                             exit_prompted = 0  # Reset exit counter since we're navigating back
                         except KeyboardInterrupt:
                             reset_console()
@@ -494,8 +733,7 @@ def main(reload: bool = False):
                         handle_review_changes(staged_changes, unstaged_changes, diff, unstaged_diff)
                     except MenuNavigationException:
                         # User pressed Ctrl-C in submenu, return to main menu
-                        reset_console()
-                        console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                        next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                         exit_prompted = 0  # Reset exit counter since we're navigating back
 
                 elif action.startswith("↑ Stage Files"):
@@ -503,12 +741,10 @@ def main(reload: bool = False):
                     with AutoRefreshSuspender():
                         try:
                             status_msg = handle_stage_files(unstaged_changes)
-                            reset_console()
-                            console.print(status_msg)
+                            next_frame(status_msg)
                         except MenuNavigationException:
                             # User pressed Ctrl-C in submenu, return to main menu
-                            reset_console()
-                            console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                            next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                             exit_prompted = 0  # Reset exit counter since we're navigating back
 
                 elif action.startswith("↓ Unstage Files"):
@@ -516,22 +752,19 @@ def main(reload: bool = False):
                     with AutoRefreshSuspender():
                         try:
                             status_msg = handle_unstage_files(staged_changes)
-                            reset_console()
-                            console.print(status_msg)
+                            next_frame(status_msg)
                         except MenuNavigationException:
                             # User pressed Ctrl-C in submenu, return to main menu
-                            reset_console()
-                            console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                            next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                             exit_prompted = 0  # Reset exit counter since we're navigating back
 
                 elif action == "Ignore Files":
                     try:
                         handle_ignore_files()
-                        reset_console()
+                        next_frame()
                     except MenuNavigationException:
                         # User pressed Ctrl-C in submenu, return to main menu
-                        reset_console()
-                        console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                        next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                         exit_prompted = 0  # Reset exit counter since we're navigating back
 
                 elif action == "View Commit History":
@@ -543,8 +776,7 @@ def main(reload: bool = False):
                             print_commit_details(selected_commit_data)
                     except MenuNavigationException:
                         # User pressed Ctrl-C in submenu, return to main menu
-                        reset_console()
-                        console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                        next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                         exit_prompted = 0  # Reset exit counter since we're navigating back
 
                 elif action == "Select Model":
@@ -555,8 +787,7 @@ def main(reload: bool = False):
                         console.print(f"[bold green]Model selected:[/bold green] {MODEL}")
                     except MenuNavigationException:
                         # User pressed Ctrl-C in submenu, return to main menu
-                        reset_console()
-                        console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                        next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                         exit_prompted = 0  # Reset exit counter since we're navigating back
 
                 elif action == "Push Repo":
@@ -570,8 +801,7 @@ def main(reload: bool = False):
                         summarize_selected_commits()
                     except MenuNavigationException:
                         # User pressed Ctrl-C in submenu, return to main menu
-                        reset_console()
-                        console.print("[bold yellow]↩️  Returned to main menu[/bold yellow]")
+                        next_frame("[bold yellow]↩️  Returned to main menu[/bold yellow]")
                         exit_prompted = 0  # Reset exit counter since we're navigating back
 
                 elif action == "Exit":
@@ -590,24 +820,9 @@ def main(reload: bool = False):
             stop_auto_refresh()
             return
 
-    if reload:
-        refresh_interval = 5
-        console.print(
-            f"[bold yellow]Auto-reload is enabled. Repository status will refresh every {refresh_interval} seconds.[/bold yellow]"
-        )
-
-        def auto_refresh():
-            while True:
-                console.print("[bold yellow]...[/bold yellow]")
-                time.sleep(refresh_interval)
-                printer.print_divider("Auto Refresh")
-                get_and_display_status()
-                sys.stdout.flush()
-
-        refresh_thread = threading.Thread(target=auto_refresh, daemon=True)
-        refresh_thread.start()
-
-    if AUTO_REFRESH and not reload:
+    if AUTO_REFRESH and AUTO_REFRESH_WATCH and WATCHDOG_AVAILABLE:
+        console.print("[bold cyan]🔄 Auto-refresh enabled - watching the repository for changes[/bold cyan]")
+    elif AUTO_REFRESH:
         console.print(
             f"[bold cyan]🔄 Auto-refresh enabled - monitoring git changes every {AUTO_REFRESH_INTERVAL}s[/bold cyan]"
         )
@@ -631,9 +846,17 @@ def main(reload: bool = False):
             logger.debug("STOPPING AUTO-REFRESH - Normal exit from main()")
         stop_auto_refresh()
         console.print("[bold green]✅ GitSmart exited cleanly[/bold green]")
+    finally:
+        # Let in-flight git subprocesses finish instead of killing daemon threads mid-call
+        if warmup_thread is not None:
+            warmup_thread.join(timeout=2)
+        shutdown_status_executor()
+        refresh_wakeup_r.close()
+        refresh_wakeup_w.close()
+
 def cmd_add_files(args):
     """Add untracked files to Git repository."""
-    from .git_utils import add_files
+    from .git_utils import add_files, split_add_candidates
     from .repo_manager import get_repo_manager, find_repo
     from .ui import console
 
@@ -664,30 +887,9 @@ def cmd_add_files(args):
             if repo_info:
                 repo_name = repo_info["name"]
 
-        # Check which files exist and are untracked
-        valid_files = []
-        invalid_files = []
-        already_tracked = []
-
-        for file_path in files:
-            if not os.path.exists(file_path):
-                invalid_files.append(file_path)
-                continue
-
-            # Check if file is already tracked
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["git", "ls-files", "--", file_path],
-                    capture_output=True, text=True, check=True
-                )
-                if result.stdout.strip():
-                    already_tracked.append(file_path)
-                else:
-                    valid_files.append(file_path)
-            except subprocess.CalledProcessError:
-                # If git ls-files fails, assume it's untracked
-                valid_files.append(file_path)
+        # Check which files exist and are untracked: one stat per file and one
+        # tracked lookup for all of them
+        invalid_files, already_tracked, valid_files = split_add_candidates(files)
 
         # Display status
         if invalid_files:
@@ -734,7 +936,8 @@ def entry_point():
     # Default command (interactive mode)
     default_parser = subparsers.add_parser('ui', help='Launch interactive UI (default)')
     default_parser.add_argument("--reload", action="store_true", help="Enable auto-refresh of repository status.")
-    default_parser.set_defaults(func=lambda args: main(reload=args.reload))
+    default_parser.add_argument("--no-banner", action="store_true", help="Skip the recent commits summary on startup.")
+    default_parser.set_defaults(func=lambda args: main(reload=args.reload, banner=not args.no_banner))
 
     # Add files command
     add_parser = subparsers.add_parser('add', help='Add untracked files to Git repository')
@@ -1,91 +1,126 @@
+from __future__ import annotations
+
 import os
+import errno
+import importlib.util
+import asyncio
+import inspect
+import logging
+import functools
+import hashlib
 import subprocess
 import socket
-import time
 import atexit
+import collections
 import threading
+import time
 from pathlib import Path
 from typing import List, Optional
 
 try:
-    from fastmcp import FastMCP, Context
-    FASTMCP_AVAILABLE = True
+    import psutil
+    PSUTIL_AVAILABLE = True
 except ImportError:
-    FASTMCP_AVAILABLE = False
-    # Create dummy classes for when fastmcp is not available
-    class FastMCP:
-        def __init__(self, name):
-            self.name = name
-        def tool(self, func):
-            return func
-        def run(self, **kwargs):
-            raise RuntimeError("FastMCP not available")
-    
-    class Context:
-        pass
+    PSUTIL_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# fastmcp (and the web stack under it) is only imported once the server starts,
+# so the CLI doesn't pay for it at startup; until then just check it's installed.
+# uvloop is only probed too, anyio creates the loop when asked to use_uvloop
+FASTMCP_AVAILABLE = importlib.util.find_spec("fastmcp") is not None
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
+class Context:
+    """Stand-in for fastmcp.Context; replaced by the real class when the server is created."""
+    pass
 
 from .config import logger, MCP_PORT, MCP_HOST, MODEL
-from .git_utils import stage_files, unstage_files, get_git_diff
+from .git_utils import stage_files, unstage_files, get_git_diff, split_add_candidates, commit_in_process
 from .ai_utils import generate_commit_message
 from .repo_manager import get_repo_manager, get_current_repo_info, switch_to_repo, find_repo
 
-# Only create the MCP instance if fastmcp is available
-if FASTMCP_AVAILABLE:
-    mcp = FastMCP("GitSmart MCP Server")
-else:
-    mcp = None
+# Created by _get_mcp() when the server starts
+mcp = None
+# Wrapped tools, registered with `mcp` once it exists
+_pending_tools = []
+
+if not FASTMCP_AVAILABLE:
     logger.warning("FastMCP not available - MCP server functionality will be disabled")
 
+def _get_mcp():
+    """Import fastmcp, create the server and register the tools. Returns None without fastmcp."""
+    global mcp, Context
+    if mcp is None and FASTMCP_AVAILABLE:
+        from fastmcp import FastMCP, Context as FastMCPContext
+        # Tool annotations are strings (postponed evaluation), so FastMCP resolves
+        # `ctx: Context` against this module and finds the real class
+        Context = FastMCPContext
+        server = FastMCP("GitSmart MCP Server")
+        for tool in _pending_tools:
+            server.tool(tool)
+        mcp = server
+    return mcp
+
 # Global server state management
 _server_lock_file = Path.home() / ".gitsmart" / "mcp_server.lock"
 _server_pid_file = Path.home() / ".gitsmart" / "mcp_server.pid"
 _server_running = False
+# Open, flocked descriptor on the lock file while this process runs the server;
+# the kernel drops the lock if the process dies, so it can't go stale
+_server_lock_fd = None
+# Monotonic time of the last positive is_server_running() probe
+_server_seen_at = None
+_SERVER_SEEN_TTL = 5.0
 
 # MCP operation coordination
 class MCPOperationState:
     """Shared state to coordinate between MCP server and CLI menu."""
     def __init__(self):
         self.lock = threading.Lock()
-        self.operation_in_progress = threading.Event()
+        # Set while nothing is running, so waiters block on it instead of polling
+        self._idle = threading.Event()
+        self._idle.set()
         self.operation_count = 0
         self.current_operation = None
     
     def start_operation(self, operation_name: str):
         """Signal that an MCP operation is starting."""
+        # The lock only covers the count and the idle edge (0 -> 1); logging happens outside it
         with self.lock:
             self.operation_count += 1
+            count = self.operation_count
             self.current_operation = operation_name
-            self.operation_in_progress.set()
-            logger.info(f"MCP operation started: {operation_name} (count: {self.operation_count})")
+            if count == 1:
+                self._idle.clear()
+        logger.info("MCP operation started: %s (count: %d)", operation_name, count)
     
     def end_operation(self, operation_name: str):
         """Signal that an MCP operation has ended."""
         with self.lock:
-            self.operation_count = max(0, self.operation_count - 1)
-            if self.operation_count == 0:
-                self.operation_in_progress.clear()
+            count = self.operation_count = max(0, self.operation_count - 1)
+            if count == 0:
+                self._idle.set()
                 self.current_operation = None
-            logger.info(f"MCP operation ended: {operation_name} (count: {self.operation_count})")
+        logger.info("MCP operation ended: %s (count: %d)", operation_name, count)
     
     def is_operation_in_progress(self) -> bool:
         """Check if any MCP operation is currently in progress."""
-        return self.operation_in_progress.is_set()
+        # Polled by the CLI menu; a plain int read is atomic, so no lock is needed
+        return self.operation_count > 0
     
     def get_current_operation(self) -> Optional[str]:
         """Get the name of the current operation."""
-        with self.lock:
-            return self.current_operation
+        # Best-effort display name; reading one attribute needs no lock
+        return self.current_operation
     
-    def wait_for_operations_to_complete(self, timeout: Optional[float] = None):
-        """Wait for all MCP operations to complete."""
-        if self.operation_in_progress.is_set():
-            # Wait for the event to be cleared (operations to complete)
-            start_time = time.time()
-            while self.operation_in_progress.is_set():
-                if timeout and (time.time() - start_time) > timeout:
-                    return False  # Timeout occurred
-                time.sleep(0.1)  # Small delay to avoid busy waiting
-        return True
+    def wait_for_operations_to_complete(self, timeout: Optional[float] = None) -> bool:
+        """Wait for all MCP operations to complete. Returns False on timeout."""
+        return self._idle.wait(timeout)
 
 # Global MCP operation state
 _mcp_state = MCPOperationState()
@@ -102,32 +137,98 @@ def get_current_mcp_operation() -> Optional[str]:
     """Get the name of the current MCP operation."""
     return _mcp_state.get_current_operation()
 
-# Context manager for MCP operations
-class MCPOperation:
-    """Context manager to track MCP operations."""
-    def __init__(self, operation_name: str):
-        self.operation_name = operation_name
-        self.state = get_mcp_state()
-    
-    def __enter__(self):
-        self.state.start_operation(self.operation_name)
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.state.end_operation(self.operation_name)
-
 def is_port_in_use(port: int, host: str = "127.0.0.1") -> bool:
-    """Check if a port is already in use."""
+    """
+    Check if a port is already in use.
+    Tries to bind it rather than connect to it, so there is no connect timeout to wait out.
+    """
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(1)
-            result = sock.connect_ex((host, port))
-            return result == 0
-    except Exception:
+            if os.name == "posix":
+                # Bind the way the server's listener will (asyncio sets SO_REUSEADDR on
+                # POSIX), so TIME_WAIT leftovers from a stopped server don't count as in use.
+                # Not on Windows, where it would let the probe bind over a live listener.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+            return False
+    except OSError as e:
+        return e.errno in (errno.EADDRINUSE, errno.EACCES)
+
+def _is_gitsmart_process(pid: int) -> bool:
+    """
+    True if `pid` looks like a GitSmart process. PIDs get recycled, so a live
+    PID from a stale PID file may belong to something unrelated.
+    Falls back to trusting the PID when the command line can't be read.
+    """
+    cmdline = None
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+    except OSError:
+        if PSUTIL_AVAILABLE:
+            try:
+                cmdline = " ".join(psutil.Process(pid).cmdline())
+            except Exception:
+                cmdline = None
+    if cmdline is None:
+        return True
+    return "gitsmart" in cmdline.lower()
+
+def _process_start_time(pid: int) -> Optional[str]:
+    """
+    Start time of `pid` (field 22 of /proc/<pid>/stat, or psutil's create_time),
+    or None when it can't be read. Together with the PID it identifies one process.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        # comm (field 2) may contain spaces; fields after it start at 3
+        return stat[stat.rindex(b")") + 2:].split()[19].decode()
+    except (OSError, ValueError, IndexError):
+        pass
+    if PSUTIL_AVAILABLE:
+        try:
+            return repr(psutil.Process(pid).create_time())
+        except Exception:
+            pass
+    return None
+
+def _lock_held_elsewhere() -> bool:
+    """True if another process holds the server lock (checked with a non-blocking shared flock)."""
+    try:
+        fd = os.open(_server_lock_file, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return False
+    except BlockingIOError:
+        return True
+    except OSError:
         return False
+    finally:
+        os.close(fd)
 
 def is_server_running() -> bool:
-    """Check if MCP server is already running."""
+    """
+    Check if MCP server is already running. Our own server counts without probing,
+    and a server seen in the last few seconds is assumed to still be up. Otherwise
+    the lock file's flock decides; the port and PID file checks are the fallback
+    where fcntl isn't available.
+    """
+    global _server_seen_at
+    if _server_running:
+        return True
+    if _server_seen_at is not None and time.monotonic() - _server_seen_at < _SERVER_SEEN_TTL:
+        return True
+
+    if FCNTL_AVAILABLE:
+        held = _lock_held_elsewhere()
+        if held:
+            _server_seen_at = time.monotonic()
+        return held
+
     # Check if port is in use
     if not is_port_in_use(MCP_PORT, MCP_HOST):
         return False
@@ -136,9 +237,24 @@ def is_server_running() -> bool:
     if _server_pid_file.exists():
         try:
             with open(_server_pid_file, 'r') as f:
-                pid = int(f.read().strip())
-            # Check if process is still running
-            os.kill(pid, 0)  # This will raise OSError if process doesn't exist
+                pid_text, _, stamped_start = f.read().strip().partition(":")
+            pid = int(pid_text)
+            start_time = _process_start_time(pid)
+            if start_time is None:
+                # No /proc or psutil: fall back to a signal-0 liveness probe
+                os.kill(pid, 0)  # This will raise OSError if process doesn't exist
+            if stamped_start and start_time is not None:
+                # Same PID but a different start time means the PID was recycled
+                is_server = stamped_start == start_time
+            else:
+                # PID file without a start time stamp
+                is_server = _is_gitsmart_process(pid)
+            if not is_server:
+                # Recycled PID: the server that wrote this file is gone
+                _server_pid_file.unlink(missing_ok=True)
+                _server_lock_file.unlink(missing_ok=True)
+                return False
+            _server_seen_at = time.monotonic()
             return True
         except (OSError, ValueError):
             # Process doesn't exist or PID file is corrupted
@@ -147,29 +263,53 @@ def is_server_running() -> bool:
     
     return False
 
-def create_server_lock():
-    """Create server lock and PID files."""
-    global _server_running
+def create_server_lock() -> bool:
+    """
+    Create server lock and PID files. Returns False if another process got the
+    lock first; with flock, checking and taking the lock is a single step.
+    """
+    global _server_running, _server_lock_fd
     _server_lock_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Create lock file
-    with open(_server_lock_file, 'w') as f:
-        f.write(str(os.getpid()))
+    if FCNTL_AVAILABLE:
+        fd = os.open(_server_lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        _server_lock_fd = fd
+    else:
+        with open(_server_lock_file, 'w') as f:
+            f.write(str(os.getpid()))
     
-    # Create PID file
+    # Create PID file, stamped with our start time so a recycled PID can't match it
+    pid = os.getpid()
+    start_time = _process_start_time(pid)
     with open(_server_pid_file, 'w') as f:
-        f.write(str(os.getpid()))
+        f.write(f"{pid}:{start_time}" if start_time else str(pid))
     
     _server_running = True
     
     # Register cleanup on exit
     atexit.register(cleanup_server_lock)
+    return True
 
 def cleanup_server_lock():
     """Clean up server lock and PID files."""
-    global _server_running
+    global _server_running, _server_seen_at, _server_lock_fd
+    _server_seen_at = None
     if _server_running:
-        _server_lock_file.unlink(missing_ok=True)
+        if _server_lock_fd is not None:
+            # Closing releases the flock. The file itself stays: unlinking it would let
+            # a process that already opened it lock a different inode than the next one
+            os.close(_server_lock_fd)
+            _server_lock_fd = None
+        else:
+            _server_lock_file.unlink(missing_ok=True)
         _server_pid_file.unlink(missing_ok=True)
         _server_running = False
 
@@ -184,9 +324,19 @@ def start_mcp_server():
         return False
     
     try:
-        create_server_lock()
+        if not create_server_lock():
+            logger.info(f"MCP server already starting in another process on {MCP_HOST}:{MCP_PORT}")
+            return False
         logger.info(f"Starting MCP server on {MCP_HOST}:{MCP_PORT}")
-        mcp.run(transport="streamable-http", host=MCP_HOST, port=MCP_PORT, path="/mcp")
+        server = _get_mcp()
+        run_kwargs = dict(transport="streamable-http", host=MCP_HOST, port=MCP_PORT, path="/mcp")
+        if UVLOOP_AVAILABLE:
+            import anyio
+            # server.run() always starts a stock asyncio loop; run it ourselves so this
+            # server thread gets uvloop without changing the process-wide loop policy
+            anyio.run(functools.partial(server.run_async, **run_kwargs), backend_options={"use_uvloop": True})
+        else:
+            server.run(**run_kwargs)
         return True
     except Exception as e:
         cleanup_server_lock()
@@ -196,26 +346,106 @@ def start_mcp_server():
 # Utility to ensure repo context
 
 def mcp_tool(func):
-    """Decorator to register MCP tools only if FastMCP is available."""
-    if FASTMCP_AVAILABLE and mcp:
-        return mcp.tool(func)
-    return func
+    """
+    Decorator to register MCP tools (with the server once it's created).
+    Logs the call lazily, tracks it in the shared MCP state (so the CLI menu
+    pauses meanwhile) and turns any exception into a failure result, so the
+    tools themselves don't each repeat the same bookkeeping.
+    """
+    name = func.__name__
+
+    def _operation_label(kwargs):
+        """Operation name the CLI shows while the call runs."""
+        if "files" in kwargs:
+            return f"{name}({len(kwargs['files'])} files)"
+        if "repo_name" in kwargs:
+            return f"{name}({kwargs['repo_name']})"
+        return name
+
+    def _log_call(kwargs):
+        if logger.isEnabledFor(logging.INFO):
+            # File lists are summarised by length rather than repr'd in full
+            logger.info("Tool called: %s with args: %s", name, {
+                k: f"<{len(v)} items>" if isinstance(v, (list, tuple)) else v
+                for k, v in kwargs.items() if k != "ctx"
+            })
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            _log_call(kwargs)
+            label = _operation_label(kwargs)
+            _mcp_state.start_operation(label)
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return {"success": False, "message": str(e)}
+            finally:
+                _mcp_state.end_operation(label)
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            _log_call(kwargs)
+            label = _operation_label(kwargs)
+            _mcp_state.start_operation(label)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                return {"success": False, "message": str(e)}
+            finally:
+                _mcp_state.end_operation(label)
+
+    _pending_tools.append(wrapper)
+    return wrapper
+
+# Last repository resolved by name, keyed on the registry files' stat signature
+_repo_context_cache = {"key": None, "info": None}
 
 def ensure_repo_context(repo_name: Optional[str] = None):
+    """
+    Resolve the repository a tool call targets and mark it current. The process
+    cwd is left alone, since tools on other threads (and the CLI) share it;
+    callers pass the returned path to git as cwd instead.
+    """
     repo_manager = get_repo_manager()
     if repo_name:
+        # Bursts of tool calls on one repo skip the registry lookups and writes
+        # until something else modifies the registry
+        cached = _repo_context_cache["info"]
+        if cached and _repo_context_cache["key"] == (repo_name, repo_manager.registry_signature()) \
+                and os.path.isdir(cached["path"]):
+            return cached
         repo_info = find_repo(repo_name)
         if not repo_info:
             raise Exception(f"Repository '{repo_name}' not found")
-        os.chdir(repo_info["path"])
         repo_manager.set_current_repository(repo_info["name"])
+        # Taken after our own writes so only outside changes invalidate it
+        _repo_context_cache.update(key=(repo_name, repo_manager.registry_signature()), info=repo_info)
         return repo_info
     else:
-        repo_info = get_current_repo_info()
-        if repo_info:
-            os.chdir(repo_info["path"])
-            repo_manager.set_current_repository(repo_info["name"])
-        return repo_info
+        # Already the current repository (get_current_repository persists a
+        # newly discovered one itself), so there's nothing to write back
+        return get_current_repo_info()
+
+# Messages that committed successfully, by (model, staged diff digest), so the same
+# staged changes committed again (after a reset or amend) skip the LLM round-trip.
+# A message whose commit failed is never kept: a commit-msg hook may have rejected
+# it, and the retry should get a fresh one.
+_commit_message_cache = collections.OrderedDict()
+_COMMIT_MESSAGE_CACHE_SIZE = 32
+
+def _diff_key(diff: str) -> tuple:
+    return MODEL, hashlib.blake2b(diff.encode("utf-8", "surrogateescape"), digest_size=16).digest()
+
+def _remember_commit_message(key: tuple, message: str) -> None:
+    _commit_message_cache[key] = message
+    _commit_message_cache.move_to_end(key)
+    if len(_commit_message_cache) > _COMMIT_MESSAGE_CACHE_SIZE:
+        _commit_message_cache.popitem(last=False)
+
+def _repo_cwd(repo_info) -> Optional[str]:
+    """Working directory for git calls on `repo_info`; None falls back to the process cwd."""
+    return repo_info["path"] if repo_info else None
 
 @mcp_tool
 def stage_file(files: List[str], repo_name: str, ctx: Context = None):
@@ -225,14 +455,9 @@ def stage_file(files: List[str], repo_name: str, ctx: Context = None):
         files: List of file paths to stage for commit
         repo_name: Name of git repository based on parent directory name (required)
     """
-    logger.info(f"Tool called: stage_file with args: files={files}, repo_name={repo_name}")
-    with MCPOperation(f"stage_file({len(files)} files)"):
-        try:
-            ensure_repo_context(repo_name)
-            result = stage_files(files)
-            return {"success": True, "message": result}
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+    repo_info = ensure_repo_context(repo_name)
+    result = stage_files(files, cwd=_repo_cwd(repo_info))
+    return {"success": True, "message": result}
 
 @mcp_tool
 def unstage_file(files: List[str], repo_name: str, ctx: Context = None):
@@ -242,17 +467,12 @@ def unstage_file(files: List[str], repo_name: str, ctx: Context = None):
         files: List of file paths to unstage (remove from staging area)
         repo_name: Name of git repository based on parent directory name (required)
     """
-    logger.info(f"Tool called: unstage_file with args: files={files}, repo_name={repo_name}")
-    with MCPOperation(f"unstage_file({len(files)} files)"):
-        try:
-            ensure_repo_context(repo_name)
-            result = unstage_files(files)
-            return {"success": True, "message": result}
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+    repo_info = ensure_repo_context(repo_name)
+    result = unstage_files(files, cwd=_repo_cwd(repo_info))
+    return {"success": True, "message": result}
 
 @mcp_tool
-def generate_commit_and_commit(repo_name: str, custom_message: Optional[str] = None, ctx: Context = None):
+async def generate_commit_and_commit(repo_name: str, custom_message: Optional[str] = None, ctx: Context = None):
     """Generate an AI commit message and commit staged changes in a specific repository.
     
     Args:
@@ -262,28 +482,36 @@ def generate_commit_and_commit(repo_name: str, custom_message: Optional[str] = N
     Returns:
         Dict with success status and commit message or error details
     """
-    logger.info(f"Tool called: generate_commit_and_commit with args: repo_name={repo_name}, custom_message={custom_message}")
-    with MCPOperation("generate_commit_and_commit"):
-        try:
-            ensure_repo_context(repo_name)
-            if custom_message:
-                commit_message = custom_message
-            else:
-                # Get the staged diff and generate commit message
-                diff = get_git_diff(staged=True)
-                if not diff:
-                    return {"success": False, "message": "No staged changes found. Please stage some files first."}
-                commit_message = generate_commit_message(MODEL, diff)
-            
-            result = subprocess.run([
-                "git", "commit", "-m", commit_message
-            ], capture_output=True, text=True)
-            if result.returncode == 0:
-                return {"success": True, "message": f"Committed: {commit_message}"}
-            else:
-                return {"success": False, "message": result.stderr}
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+    repo_info = ensure_repo_context(repo_name)
+    key = None
+    if custom_message:
+        commit_message = custom_message
+    else:
+        # Get the staged diff and generate commit message
+        diff = get_git_diff(staged=True, cwd=_repo_cwd(repo_info))
+        if not diff:
+            return {"success": False, "message": "No staged changes found. Please stage some files first."}
+        key = _diff_key(diff)
+        commit_message = _commit_message_cache.get(key)
+        if commit_message is None:
+            # The LLM call can take many seconds; run it off the event loop so
+            # the server keeps answering other tool calls meanwhile
+            commit_message = await asyncio.get_running_loop().run_in_executor(
+                None, generate_commit_message, MODEL, diff
+            )
+
+    if not commit_in_process(commit_message, _repo_cwd(repo_info)):
+        # Message goes in on stdin: no argv size limit for long generated bodies
+        result = subprocess.run([
+            "git", "commit", "-F", "-"
+        ], input=commit_message, capture_output=True, text=True, cwd=_repo_cwd(repo_info))
+        if result.returncode != 0:
+            if key is not None:
+                _commit_message_cache.pop(key, None)
+            return {"success": False, "message": result.stderr}
+    if key is not None and commit_message:
+        _remember_commit_message(key, commit_message)
+    return {"success": True, "message": f"Committed: {commit_message}"}
 
 @mcp_tool
 def add_files(files: List[str], repo_name: str, ctx: Context = None):
@@ -296,55 +524,37 @@ def add_files(files: List[str], repo_name: str, ctx: Context = None):
     Returns:
         Dict with success status, added files, and any files that couldn't be added
     """
-    logger.info(f"Tool called: add_files with args: files={files}, repo_name={repo_name}")
-    with MCPOperation(f"add_files({len(files)} files)"):
+    repo_cwd = _repo_cwd(ensure_repo_context(repo_name))
+    # One stat per file and one tracked lookup for all of them
+    invalid_files, already_tracked, valid_files = split_add_candidates(files, cwd=repo_cwd)
+    messages = []
+    if invalid_files:
+        messages.append(f"Files not found: {', '.join(invalid_files)}")
+    if already_tracked:
+        messages.append(f"Already tracked: {', '.join(already_tracked)}")
+    if valid_files:
         try:
-            ensure_repo_context(repo_name)
-            valid_files = []
-            invalid_files = []
-            already_tracked = []
-            for file_path in files:
-                if not os.path.exists(file_path):
-                    invalid_files.append(file_path)
-                    continue
-                try:
-                    result = subprocess.run([
-                        "git", "ls-files", "--", file_path
-                    ], capture_output=True, text=True, check=True)
-                    if result.stdout.strip():
-                        already_tracked.append(file_path)
-                    else:
-                        valid_files.append(file_path)
-                except subprocess.CalledProcessError:
-                    valid_files.append(file_path)
-            messages = []
-            if invalid_files:
-                messages.append(f"Files not found: {', '.join(invalid_files)}")
-            if already_tracked:
-                messages.append(f"Already tracked: {', '.join(already_tracked)}")
-            if valid_files:
-                try:
-                    result = subprocess.run(["git", "add"] + valid_files, capture_output=True, text=True, check=True)
-                    messages.append(f"Successfully added: {', '.join(valid_files)}")
-                    success = True
-                except subprocess.CalledProcessError as e:
-                    messages.append(f"Git add failed: {e.stderr}")
-                    success = False
-            else:
-                if not invalid_files and not already_tracked:
-                    messages.append("No valid untracked files to add")
-                success = len(invalid_files) == 0 and len(already_tracked) == 0
-            return {
-                "success": success,
-                "message": "; ".join(messages),
-                "added_files": valid_files,
-                "invalid_files": invalid_files,
-                "already_tracked": already_tracked,
-                "operation": "add",
-                "repository": repo_name or "current"
-            }
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+            result = subprocess.run(
+                ["git", "add"] + valid_files, capture_output=True, text=True, check=True, cwd=repo_cwd
+            )
+            messages.append(f"Successfully added: {', '.join(valid_files)}")
+            success = True
+        except subprocess.CalledProcessError as e:
+            messages.append(f"Git add failed: {e.stderr}")
+            success = False
+    else:
+        if not invalid_files and not already_tracked:
+            messages.append("No valid untracked files to add")
+        success = len(invalid_files) == 0 and len(already_tracked) == 0
+    return {
+        "success": success,
+        "message": "; ".join(messages),
+        "added_files": valid_files,
+        "invalid_files": invalid_files,
+        "already_tracked": already_tracked,
+        "operation": "add",
+        "repository": repo_name or "current"
+    }
 
 @mcp_tool
 def list_repositories(ctx: Context = None):
@@ -353,14 +563,8 @@ def list_repositories(ctx: Context = None):
     Returns:
         Dict containing a list of all registered repository names
     """
-    logger.info("Tool called: list_repositories")
-    with MCPOperation("list_repositories"):
-        try:
-            repo_manager = get_repo_manager()
-            repos = repo_manager.list_repositories()
-            return {"repositories": list(repos.keys())}
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+    # Cached in the manager until the registry changes
+    return {"repositories": list(get_repo_manager().list_repository_names())}
 
 @mcp_tool
 def switch_repository(repo_name: str, ctx: Context = None):
@@ -372,17 +576,12 @@ def switch_repository(repo_name: str, ctx: Context = None):
     Returns:
         Dict with success status and confirmation message
     """
-    logger.info(f"Tool called: switch_repository with args: repo_name={repo_name}")
-    with MCPOperation(f"switch_repository({repo_name})"):
-        try:
-            repo_manager = get_repo_manager()
-            success, prev_dir = switch_to_repo(repo_name)
-            if success:
-                return {"success": True, "message": f"Switched to {repo_name}"}
-            else:
-                return {"success": False, "message": f"Could not switch to {repo_name}"}
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+    success, prev_dir = switch_to_repo(repo_name)
+    _repo_context_cache.update(key=None, info=None)
+    if success:
+        return {"success": True, "message": f"Switched to {repo_name}"}
+    else:
+        return {"success": False, "message": f"Could not switch to {repo_name}"}
 
 @mcp_tool
 def get_repository_status(repo_name: str, ctx: Context = None):
@@ -394,15 +593,10 @@ def get_repository_status(repo_name: str, ctx: Context = None):
     Returns:
         Dict with detailed repository information including name, path, branch, and change status
     """
-    logger.info(f"Tool called: get_repository_status with args: repo_name={repo_name}")
-    with MCPOperation(f"get_repository_status({repo_name})"):
-        try:
-            ensure_repo_context(repo_name)
-            repo_manager = get_repo_manager()
-            repo_info = repo_manager.get_current_repository()
-            return repo_info
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+    ensure_repo_context(repo_name)
+    repo_manager = get_repo_manager()
+    repo_info = repo_manager.get_current_repository()
+    return repo_info
 
 if __name__ == "__main__":
     start_mcp_server() 
\ No newline at end of file
@@ -1,445 +1,122 @@
-# ----------------------------------------------------
-# DIFF ANALYSIS AND COMMIT MESSAGE GENERATION
-# ----------------------------------------------------
-
-SYSTEM_MESSAGE = """You are to act as an author of a commit message in Git. **Create a Concise, Expert-Level Commit Message** that follows the **Conventional Commit Convention** (No Emoji Required).
-
-**Objective**: Generate a commit message that provides a clear **WHAT** and **WHY** explanation in a unified, structured message, ideally keeping each line under 74 characters. Use a thorough, step-by-step thought process to ensure accuracy and adherence to conventional commit style.
-
----
-
-### Step-by-Step Process for Writing the Commit Message
-
-#### 1. **Analyze Changes in Detail**
-   - Review the provided `git diff --staged` output.
-   - For each change, identify **WHAT** was modified (e.g., new functions, logic updates, helper functions) and **WHY** it was necessary (e.g., to improve functionality, handle constraints, enhance performance).
-
-#### 2. **Identify Core Changes and Group Them**
-   - **List each key change** along with its purpose before drafting the commit message.
-   - Organize changes into categories if applicable (e.g., new functions, refactoring, logic updates) to ensure no major change is overlooked and to provide structure.
-
-#### 3. **Determine Commit Type and Scope (File Name)**
-   - Select a **commit type** based on the main purpose of the changes:
-     - **feat**: Introduces new functionality.
-     - **fix**: Resolves a bug or unexpected behavior.
-     - **refactor**: Improves code structure or readability without changing functionality.
-     - **docs**: Adds or updates documentation (e.g., README updates).
-     - **config**: Adds or updates configuration files or settings.
-     - **cleanup**: Improves readability, removes clutter, or deletes unused code.
-     - **test**: Adds or updates tests.
-     - **hotfix**: Applies an urgent fix that should be deployed immediately.
-
-   - **Scope (File or Module)**: After the commit type, include the file name or module name in parentheses to indicate the scope of the change.
-     - For example, `feat(main.py):` or `fix(api/auth.py):`.
-
-   - **If Multiple Types Apply**:
-     - **Prioritize** the main intent of the commit. Choose the commit type that best reflects the primary purpose (e.g., `feat` if adding a new feature that also fixes a minor bug).
-     - **Dual Types (Only When Necessary)**: Use dual types (e.g., `feat, fix:`) sparingly, only if the changes are equally split between two critical purposes. Avoid this unless both types are essential to the commit’s purpose.
-     - **Justify Each Type**: In your **Observations and Rationale** section, explain why each chosen type is relevant.
-
-#### 4. **Compose the Commit Message**
-   - **Summary Line**: Start with the commit type and file name(s) in parentheses, followed by a concise summary of the changes.
-      - Example for single type: `feat(main.py): add function to truncate diff based on token limit`
-      - Example for dual type: `feat(api.py), fix(utils.py): add auth feature and fix bug`
-   - **Detailed Explanation**:
-      - **WHAT**: Describe the main changes, summarizing the modifications concisely.
-      - **WHY**: Explain the motivation behind these changes, addressing constraints, goals, or issues the changes resolve.
-   - **Bullet Points for Complex Changes**: If multiple parts or steps were involved, use bullet points to clarify each key step or modification. This is especially helpful for complex commits that involve multiple functions or adjustments.
-
-#### 5. **Iterate and Refine**
-   - **Review Your Observations**: Ensure that all major changes from the `git diff --staged` output are included.
-   - **Verify Commit Type and Message Structure**: Confirm that the commit message begins with the correct commit type and follows a clear **WHAT** and **WHY** structure.
-   - **Check Line Lengths**: Aim to keep lines under 74 characters for readability.
-   - **Avoid Redundancies**: Make sure the message is concise and free of unnecessary repetition.
-
-#### 6. **Provide Observations and Reasoning**
-   - Summarize **observations** from `git diff --staged`, listing each key change and its purpose.
-   - **Justify the Commit Type(s)** based on the primary purpose of the changes. Clearly explain why each chosen type (e.g., `feat`, `fix`, `refactor`) is appropriate, and specify the scope (file name or module) for each type.
-
----
-
-### Output Format
-
-```markdown
-# **Required** Step-by-Step analysis of the Changes Here:
-1. **Observations**: [Key changes and context notes]
-2. **Rationale**: [Chosen Icon and theme]
-
-# Finally, produce the final commit message based on your analysis.
-<COMMIT_MESSAGE>
-[Final commit message with file scope]
-</COMMIT_MESSAGE>
-```
-
----
-
-### Example for Single and Dual Type Commits with Scope
-
-#### Example 1 (Single Type Commit)
-
-**Input**: `git diff --staged` shows a new function `truncate_diff` for handling large diffs in `main.py`, and updates to `generate_commit_message` in the same file to ensure truncation logic is applied when token limits are exceeded.
-
-```markdown
-**Step-by-Step Thinking:**
-
-1. **Observations**:
-   - Added `truncate_diff` function to manage large diffs within token limits in `main.py`.
-   - Updated `generate_commit_message` to use `truncate_diff` when token limit is exceeded.
-   - Added logging for token usage and truncation status.
-
-2. **Rationale**:
-   - **Commit type**: `feat(main.py)`
-   - **Reasoning**: `feat` is appropriate because `truncate_diff` introduces new functionality that improves how the system handles large diffs within token constraints.
-
-<COMMIT_MESSAGE>
-feat(main.py): add diff truncation to manage token limits in requests
-
-Introduce `truncate_diff` to handle large diffs by trimming them to fit within
-a specified token limit. Updated `generate_commit_message` to use this function
-when token limits are exceeded.
-
-- Added logging to track token usage and truncation status.
-</COMMIT_MESSAGE>
-```
-
----
-
-#### Example 2 (Dual Type Commit)
-
-**Input**: `git diff --staged` shows a new function `truncate_diff` for handling large diffs in `api.py`, a bug fix in `generate_commit_message` in `utils.py` to handle token overflow, and related refactoring.
-
-```markdown
-**Step-by-Step Thinking:**
-
-1. **Observations**:
-   - Added `truncate_diff` function to manage large diffs within token limits in `api.py`.
-   - Fixed a bug in `generate_commit_message` in `utils.py` that caused token overflow.
-   - Refactored code in `generate_commit_message` to improve readability.
-
-2. **Rationale**:
-   - **Commit types**: `feat(api.py), fix(utils.py)`
-   - **Reasoning**: `feat` for the new functionality in `truncate_diff`, and `fix` for addressing a critical token overflow bug in `generate_commit_message`.
-
-<COMMIT_MESSAGE>
-feat(api.py), fix(utils.py): add diff truncation and resolve overflow bug
-
-Introduce `truncate_diff` to handle large diffs within token limits, retaining
-important context at the start and end. Fixed an overflow bug in
-`generate_commit_message` in `utils.py` that caused token limits to be exceeded.
-
-- Refactored `generate_commit_message` for improved readability.
-- Added logging for token count after truncation.
-</COMMIT_MESSAGE>
-```
-
----
-
-### Important Notes
-
-1. **Use Present Tense and Imperative Mood**: Write in the imperative (e.g., "Add function" rather than "Added function").
-2. **Include File or Module Scope**: After the commit type, add the affected file or module in parentheses to specify scope (e.g., `feat(main.py):`).
-3. **Dual Types Only When Necessary**: Use dual types sparingly, only when both changes are equally important.
-4. **Review for Completeness**: Double-check that all critical changes and reasons are covered in observations before finalizing the message."""
-
-
-
-USER_MSG_APPENDIX = """
----
-
-## **IMPORTANT** COMMIT MESSAGE GUIDELINES:
-1. **Comprehensive Analysis of All Changes**:
-   - Carefully review the `git diff` above to identify **all changes**.
-   - Think step-by-step about each change to fully understand its purpose and impact.
-
-2. **Identify the WHAT, WHY, and WHERE.**:
-   - Clarify **WHAT** was changed and **WHY** each change was necessary.
-   - Formulate these points clearly before drafting the commit message.
-
-3. **Select Commit Types**:
-   - Choose the most relevant commit type(s) (e.g., `feat:`, `fix:`, or `feat, fix:`).
-   - If multiple types apply, select the type that best reflects the main purpose, or use a dual type format if both are essential.
-
-4. **FINALLY, Compose an Exhaustive Commit Message**:
-   - First line: Start with the chosen commit type(s) and a concise summary.
-   - Follow with detailed explanation lines as needed to ensure the message is **absolutely exhaustive**.
-   - Use present tense and imperative mood (e.g., "Add helper function" not "Added helper function").
-
-## INSTRUCTIONS
-1. TASK 1: **Review the diff carefully** to ensure you identify **all changes**.
-2. TASK 2: Think step-by-step to understand **WHAT** and **WHY** for each change, then choose the commit type(s).
-3. TASK 3: Write a complete commit message that captures **all details** of the changes. Place the final message between `<COMMIT_MESSAGE>` tags.
-
-## CRITICAL: NEVER PRODUCE THE FINAL COMMIT MESSAGE BEFORE PROVIDING AN EXAUHSTIVE ANALYSIS OF ALL THE CHANGES.
-
-## CRITICAL: If the final commit message is not encased within <COMMIT_MESSAGE> and </COMMIT_MESSAGE>, it will not be properly parsed and you will be terminated.
-
-Now begin your step-by-step review of ALL changes made across ALL files above. Finally, produce a masterful commit message in the required format between angled brackets <COMMIT_MESSAGE>details here </COMMIT_MESSAGE>.
-"""
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
+# The prompt texts live in prompt_templates/ and are read on first access
+# (PEP 562 module __getattr__), so importing this module costs nothing and a
+# run that only summarizes never reads the commit-message prompts.
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompt_templates")
+
+# Read-only so no caller can repoint a prompt name at another file mid-process
+_TEMPLATES = MappingProxyType({
+    # ----------------------------------------------------
+    # DIFF ANALYSIS AND COMMIT MESSAGE GENERATION
+    # ----------------------------------------------------
+    "SYSTEM_MESSAGE": "system.txt",
+    "USER_MSG_APPENDIX": "user_appendix.txt",
+    "USER_MSG_APPENDIX_EMOJI": "user_appendix_emoji.txt",
+    # ----------------------------------------------------
+    # SUMMARIZE COMMITS
+    # ----------------------------------------------------
+    "SUMMARIZE_COMMIT_PROMPT": "summarize.txt",
+})
+
+
+@lru_cache(maxsize=None)
+def _read_template(filename: str) -> str:
+    # newline="" keeps the text byte-for-byte as stored
+    with open(os.path.join(_TEMPLATE_DIR, filename), encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+# Wraps the formatted diff (and optional user notes) at the start of the user message
+_DIFF_HEADER = "START BY CAREFULLY REVIEWING THE FOLLOWING DIFF(S):\n\n"
+
+
+def assemble_diff_content(formatted_diff: str, custom_notes: str = None) -> str:
+    """
+    Build the diff part of the user message in a single join rather than
+    repeated concatenation of a diff-sized string.
+    """
+    parts = [_DIFF_HEADER, formatted_diff]
+    if custom_notes:
+        parts += ["\n\n## Custom User Notes\n```\n", custom_notes, "\n```\n"]
+    return "".join(parts)
 
-SYSTEM_MESSAGE_EMOJI = """You are to act as an author of a commit message in Git. Create a Concise, Expert-Level Commit Message that follows the Conventional Commit Convention, providing a clear WHAT and WHY explanation in a unified, structured message (aim for <74 characters per line). Use a thorough, step-by-step thought process to ensure accuracy. You may optionally include an emoji (icon) if appropriate.
-
----
-1. ANALYZE CHANGES IN DETAIL
-   - Review the provided git diff --staged output.
-   - Identify WHAT was modified (e.g., new functions, bug fixes, refactors) and WHY it was necessary (e.g., to solve a bug, add a feature, address constraints).
-
-2. IDENTIFY CORE CHANGES AND GROUP THEM
-   - List each key change and its purpose.
-   - Organize them in logical categories (e.g., new function, refactor, logic update), ensuring all relevant changes are accounted for.
-
-3. DETERMINE COMMIT TYPE AND SCOPE
-   - Select the Single or Dual commit type(s) that best reflect(s) the overall purpose:
-       • feat:     Introduces new functionality.
-       • fix:      Resolves a bug or unexpected behavior.
-       • refactor: Improves code structure/readability without changing behavior.
-       • docs:     Adds or updates documentation.
-       • config:   Adds or updates configuration files or settings.
-       • cleanup:  Removes clutter, unused code, or improves readability.
-       • test:     Adds or updates tests.
-       • hotfix:   Applies a quick/urgent fix needed immediately.
-     - If multiple types seem relevant, pick the main type unless two are truly essential. Then use dual types (e.g., feat, fix:), but do so sparingly.
-   - Include a scope in parentheses to identify the file or module (e.g., feat(main.py): or fix(api/auth.py):).
-
-4. COMPOSE THE COMMIT MESSAGE
-   - Summary line:
-       • Must begin with the chosen commit type(s) + scope + a concise summary.
-       • Example single type: feat(main.py): add function to handle new token logic
-       • Example dual type: feat(api.py), fix(utils.py): add feature & fix bug
-   - Detailed explanation:
-       • WHAT: Summarize the changes made.
-       • WHY:  Explain the motivation, addressing constraints, bug fixes, or improvements.
-   - Use bullet points for complex or multiple changes to clarify each separate adjustment or function.
-
-5. (REQUIRED) INCLUDE AN EMOJI (ICON)
-   - Prepend an icon to your summary line. Choose from the allowed list below:
-
-     ALLOWED ICONS:
-     • 🐛 Fix        – Resolve a bug
-     • ✨ Feature    – Introduce new features or functionality
-     • 📝 Docs       – Document or update documentation
-     • 🚀 Deploy     – Deploy code or prepare for release
-     • ✅ Tests      – Add or update tests
-     • ♻️ Refactor   – Improve or restructure code without changing functionality
-     • ⬆️ Upgrade    – Update dependencies or libraries
-     • 🔧 Config     – Add or update configuration
-     • 🌐 i18n       – Set up or refine internationalization
-     • 💡 Comments   – Add or revise code comments
-     • 💄 UI         – Enhance user interface/styling
-     • 🔒 Security   – Strengthen security measures
-     • 🔥 Remove     – Remove or delete dead code/files
-     • 🚑 Hotfix     – Apply a critical, immediate fix
-     • 🗃️ Data       – Modify or migrate data structures
-     • 🧪 Experiment – Add experimental code or features
-     • ⚙️ Build      – Modify build scripts or tooling
-     • 📦 Package    – Manage package files (e.g., package.json)
-     • 🏗️ Structure  – Reorganize project or folder structure
-     • 🚨 Lint       – Fix or address linter issues
-     • 📈 Analytics  – Add or enhance tracking/analytics
-     • 🧹 Cleanup    – Remove clutter or improve readability
-
-     You may combine icons if you are truly addressing multiple essential purposes.
-
-6. ITERATE AND REFINE
-   - Ask yourself if the commit message covers all significant changes from the diff.
-   - Confirm the commit type is accurate and the lines are concise (<74 chars each).
-   - Eliminate redundant statements to maintain clarity.
-
-7. PROVIDE OBSERVATIONS AND RATIONALE
-   - Summarize your step-by-step observations from the diff.
-   - Explain why you chose the stated commit type(s) and (optional) icon(s).
-
----
-OUTPUT FORMAT
-
-```markdown
-# **Required** Step-by-Step Analysis of the Changes:
-1. **Observations**: [Describe each major change in detail: what & why]
-2. **Rationale**: [List chosen commit type(s) & optional icon(s); explain why]
-
-# Finally, produce the final commit message:
-<COMMIT_MESSAGE>
-[Commit message goes here in the recommended format]
-</COMMIT_MESSAGE>
-```
-
----
-EXAMPLE (Showcasing Optional Icon, Dual Commit Type):
-
-**Step-by-Step Analysis of the Changes**:
-1. Observations:
-   - Added `truncate_diff` function to manage large diffs within token limits in `api.py`.
-   - Fixed a bug in `generate_commit_message` in `utils.py` that caused token overflow.
-   - Refactored code in `generate_commit_message` to improve readability.
-
-2. Rationale:
-   - Icons & Types: ✨ feat(api.py), 🐛 fix(utils.py)
-   - Reasoning: We added new functionality (diff truncation) and fixed a critical bug (token overflow).
-
-<COMMIT_MESSAGE>
-✨🐛 feat(api.py), fix(utils.py): add diff truncation and resolve overflow bug
-
-Introduce `truncate_diff` to handle large diffs within token limits, retaining
-important context at the start and end. Fixed an overflow bug in
-`generate_commit_message` in `utils.py` that caused token limits to be exceeded.
-
-- Refactored `generate_commit_message` for improved readability.
-- Added logging for token count after truncation.
-</COMMIT_MESSAGE>
-
----
-IMPORTANT GUIDELINES
-1. Use present tense and imperative mood (e.g., “Add function” not “Added function”).
-2. Include the file or module scope in parentheses after the commit type (e.g., feat(main.py):).
-3. Use dual types (feat, fix:) only when absolutely necessary.
-4. Verify that the message is exhaustive yet concise, ensuring all important changes and their motivations are covered.
-5. Limit each line to <74 characters for readability.
-"""
-
-USER_MSG_APPENDIX_EMOJI = """
----
-
-## **IMPORTANT** COMMIT MESSAGE GUIDELINES:
-1. **Comprehensive Analysis of All Changes**:
-   - Carefully review the `git diff` above to identify **all changes**.
-   - Think step-by-step about each change to fully understand its purpose and impact.
-
-2. **Identify the WHAT, WHY, and WHERE.**:
-   - Clarify **WHAT** was changed and **WHY** each change was necessary.
-   - Formulate these points clearly before drafting the commit message.
-
-3. **Select Emoji(s) / Commit Type(s)**:
-   - Choose the most relevant commit type(s) (e.g., ✨ feat(filename.c), 🐛 fix(filename.etc)).
-   - If multiple types apply, select the type that best reflects the main purpose, or use a dual type format if both are essential.
-
-4. **FINALLY, Compose an Exhaustive Commit Message**:
-   - First line: Start with the chosen commit type(s) and a concise summary.
-   - Follow with detailed explanation lines as needed to ensure the message is **absolutely exhaustive**.
-   - Use present tense and imperative mood (e.g., "Add helper function" not "Added helper function").
-
-## INSTRUCTIONS
-1. TASK 1: **Review the diff carefully** to ensure you identify **all changes**.
-2. TASK 2: Think step-by-step to understand **WHAT** and **WHY** for each change, then choose the commit type(s).
-3. TASK 3: Write a complete commit message that captures **all details** of the changes. Place the final message between `<COMMIT_MESSAGE>` tags.
-
-## CRITICAL REMINDER: NEVER PRODUCE THE FINAL COMMIT MESSAGE BEFORE PROVIDING AN EXAUHSTIVE ANALYSIS OF ALL THE CHANGES.
-
-Now begin your step-by-step review of the file changes for the commit above. Finally, produce a masterful commit message in the required format between angled brackets `<COMMIT_MESSAGE>commit message here</COMMIT_MESSAGE>`.
-
-CRITICAL: If the final commit message is not encased within <COMMIT_MESSAGE> and </COMMIT_MESSAGE>, it will not be properly parsed and you will be terminated.
-
-P.S. Don't forget to carefully select the emoji(s). They're required at the start every commit!
-"""
 
 # ----------------------------------------------------
-# SUMMARIZE COMMITS
+# EMOJI ICONS
 # ----------------------------------------------------
 
-SUMMARIZE_COMMIT_PROMPT = """<system_prompt>
-YOU ARE A VERSION CONTROL AND RELEASE NOTES EXPERT. YOUR TASK IS TO TRANSFORM A SERIES OF COMMIT MESSAGES INTO PROFESSIONAL, CONCISE, AND WELL-STRUCTURED RELEASE
-NOTES THAT CAPTURE THE ESSENCE OF THE CHANGES MADE. FOLLOW THESE
-CAREFULLY DEFINED STEPS TO PRODUCE INDUSTRY-STANDARD RELEASE NOTES SUITED TO A TECHNICAL AUDIENCE.
-
----
-
-### PHASE 1: COMMIT ANALYSIS
-1. **Review Commit Messages**:
-   - Identify **common themes** (e.g., bug fixes, new features,
-refactors).
-   - Highlight **significant changes** (major updates, impactful fixes).
-   - Determine **purpose** (why changes were made, their context).
-   - Note **dependencies or relationships** between commits.
-
-2. **Address Edge Cases**:
-   - **Highly Technical Commits**: Simplify terms for broader understanding while preserving detail.
-   - **Conflicting Changes**: Acknowledge briefly, then emphasize overarching impact.
-   - **Unrelated Changes**: Mention them but prioritize dominant themes.
-
----
-
-### PHASE 2: GROUPING AND SYNTHESIS
-1. **Group Related Changes**:
-   - Organize updates under thematic categories (e.g., "Bug Fixes," "Improvements").
-   - Aggregate minor updates (e.g., typo corrections) into concise summaries.
-
-2. **Prioritize Themes**:
-   - Focus on changes with the greatest impact on the project or end-user experience.
-   - Define "dominant theme" as the area with the most commits or the largest contribution to project goals.
-
----
-
-### PHASE 3: FORMATTING RELEASE NOTES
-1. **Use Standard Structure**:
-   ```
-   # [Project Name] Release Notes v[Version Number]
-   Generated on: [Date]
-
-   ## Summary
-   This release includes [number] changes:
-   - [Number] improvements and/or fixes.
-   **Note:** This release has been marked as `[Impact Level]`.
+# Rendered after the rest of SYSTEM_MESSAGE_EMOJI so editing the icon set
+# leaves the leading part of the prompt, and any cached prefix, unchanged.
+_ICON_ROWS = (
+    ("🐛", "Fix", "Resolve a bug"),
+    ("✨", "Feature", "Introduce new features or functionality"),
+    ("📝", "Docs", "Document or update documentation"),
+    ("🚀", "Deploy", "Deploy code or prepare for release"),
+    ("✅", "Tests", "Add or update tests"),
+    ("♻️", "Refactor", "Improve or restructure code without changing functionality"),
+    ("⬆️", "Upgrade", "Update dependencies or libraries"),
+    ("🔧", "Config", "Add or update configuration"),
+    ("🌐", "i18n", "Set up or refine internationalization"),
+    ("💡", "Comments", "Add or revise code comments"),
+    ("💄", "UI", "Enhance user interface/styling"),
+    ("🔒", "Security", "Strengthen security measures"),
+    ("🔥", "Remove", "Remove or delete dead code/files"),
+    ("🚑", "Hotfix", "Apply a critical, immediate fix"),
+    ("🗃️", "Data", "Modify or migrate data structures"),
+    ("🧪", "Experiment", "Add experimental code or features"),
+    ("⚙️", "Build", "Modify build scripts or tooling"),
+    ("📦", "Package", "Manage package files (e.g., package.json)"),
+    ("🏗️", "Structure", "Reorganize project or folder structure"),
+    ("🚨", "Lint", "Fix or address linter issues"),
+    ("📈", "Analytics", "Add or enhance tracking/analytics"),
+    ("🧹", "Cleanup", "Remove clutter or improve readability"),
+)
+
+
+def render_icons_table(rows=_ICON_ROWS) -> str:
+    """Render the ALLOWED ICONS section appended to the emoji system prompt."""
+    lines = [f"• {icon} {name:<10} – {description}" for icon, name, description in rows]
+    return "---\nALLOWED ICONS:\n" + "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=None)
+def _system_message_emoji() -> str:
+    return _read_template("system_emoji.txt") + "\n" + render_icons_table()
+
+
+def get_prompt(name: str) -> str:
+    """
+    Return the prompt text registered under `name` (e.g. "SYSTEM_MESSAGE").
+    The same str object is returned on every call for the life of the process.
+    """
+    if name == "SYSTEM_MESSAGE_EMOJI":
+        return _system_message_emoji()
+    return _read_template(_TEMPLATES[name])
+
+
+def __getattr__(name: str) -> str:
+    try:
+        return get_prompt(name)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_TEMPLATES) + ["SYSTEM_MESSAGE_EMOJI"])
 
-   ## Changes & Improvements
-   - **[Key Change 1]**
-     [Brief Description]
-   - **[Key Change 2]**
-     [Brief Description]
-   ```
 
-2. **Define Key Components**:
-   - **Impact Level**: Use terms like "high," "medium," "low," with justification (e.g., critical fixes, performance upgrades).
-   - **Dependencies**: Mention significant inter-commit relationships if relevant to the release.
-
-3. **Tailor for Audience**:
-   - For **technical stakeholders**: Include concise, relevant technical details.
-   - For **non-technical stakeholders**: Simplify descriptions, focusing on benefits (e.g., "improved reliability").
-
----
-
-### PHASE 4: FINALIZATION
-1. **Clarity and Precision**:
-   - Review language for clarity, avoiding excessive jargon.
-   - Ensure descriptions are brief yet informative.
-
-2. **Templates for Edge Cases**:
-   - **Major Update Example**:
-     ```
-     # Gitsage Release Notes v1.0.0
-     Generated on: 2025-02-01
-
-     ## Summary
-     This release includes 5 changes:
-     - 3 new features and 2 performance improvements.
-     **Note:** This release has been marked as `high` impact.
-
-     ## Changes & Improvements
-     - **New Analytics Dashboard**
-       Introduced a comprehensive dashboard for enhanced data visualization.
-     - **Improved Query Performance**
-       Optimized database queries, reducing load times by 40%.
-     ```
-   - **Hotfix Example**:
-     ```
-     # Gitsage Release Notes v1.0.1
-     Generated on: 2025-02-15
-
-     ## Summary
-     This release addresses a critical issue:
-     - 1 bug fix.
-     **Note:** This release has been marked as `urgent` impact.
-
-     ## Fixes
-     - **Resolved Authentication Bug**
-       Fixed an issue causing intermittent failures during login.
-     ```
-
-3. **Final Review**:
-   - Verify alignment with instructions.
-   - Test clarity and impact using edge cases.
-
----
+# ----------------------------------------------------
+# PROMPT CACHING
+# ----------------------------------------------------
 
-### WHAT NOT TO DO
-- **DO NOT** list each commit verbatim.
-- **DO NOT** omit significant changes, even for minor updates.
-- **DO NOT** include excessive technical jargon without context.
-</system_prompt>"""
+def build_system_blocks(prompt: str) -> list:
+    """
+    The system prompt as one content block marked for provider-side prompt
+    caching (`cache_control`). The prompts are fixed strings sent first, so
+    the cached prefix is byte-identical across calls; the diff only ever
+    follows in the user message.
+    """
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
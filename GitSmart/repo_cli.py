@@ -23,6 +23,7 @@ import os
 import sys
 import json
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional, List
 
@@ -42,9 +43,14 @@ def print_error(message: str):
     console.print(f"[bold red]❌ {message}[/bold red]")
 
 
+def format_warning(message: str) -> str:
+    """Warning message markup, for printing directly or as part of a larger render."""
+    return f"[bold yellow]⚠️  {message}[/bold yellow]"
+
+
 def print_warning(message: str):
     """Print warning message."""
-    console.print(f"[bold yellow]⚠️  {message}[/bold yellow]")
+    console.print(format_warning(message))
 
 
 def print_info(message: str):
@@ -52,22 +58,24 @@ def print_info(message: str):
     console.print(f"[cyan]ℹ️  {message}[/cyan]")
 
 
-def format_time_ago(timestamp: float) -> str:
-    """Format timestamp as 'time ago' string."""
-    now = time.time()
-    diff = now - timestamp
+# (upper bound in seconds, unit length in seconds, unit name)
+_TIME_AGO_BUCKETS = (
+    (3600, 60, "minute"),
+    (86400, 3600, "hour"),
+    (float("inf"), 86400, "day"),
+)
+
+
+def format_time_ago(timestamp: float, now: Optional[float] = None) -> str:
+    """Format timestamp as 'time ago' string, relative to `now` (default: current time)."""
+    diff = (time.time() if now is None else now) - timestamp
 
     if diff < 60:
         return "just now"
-    elif diff < 3600:
-        minutes = int(diff / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif diff < 86400:
-        hours = int(diff / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    else:
-        days = int(diff / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
+    for limit, unit, label in _TIME_AGO_BUCKETS:
+        if diff < limit:
+            count = int(diff / unit)
+            return f"{count} {label}{'s' if count != 1 else ''} ago"
 
 
 def cmd_list_repositories(args):
@@ -87,8 +95,9 @@ def cmd_list_repositories(args):
     current_repo = registry.get_current_repository()
     current_repo_id = current_repo.repo_id if current_repo else None
 
-    # Display repositories in a table format
-    console.print()
+    # Display repositories in a table format; collected and rendered in one print
+    lines = [""]
+    now = time.time()
     for i, repo in enumerate(repositories, 1):
         is_current = repo.repo_id == current_repo_id
         status_icon = "👉" if is_current else "  "
@@ -97,24 +106,25 @@ def cmd_list_repositories(args):
         path_exists = os.path.exists(repo.path)
         path_icon = "📂" if path_exists else "❓"
 
-        console.print(f"{status_icon} {i}. [bold]{repo.name}[/bold] {path_icon}")
-        console.print(f"      Path: {repo.path}")
+        lines.append(f"{status_icon} {i}. [bold]{repo.name}[/bold] {path_icon}")
+        lines.append(f"      Path: {repo.path}")
 
         if repo.remote_url:
-            console.print(f"      Remote: {repo.remote_url}")
+            lines.append(f"      Remote: {repo.remote_url}")
 
-        console.print(f"      Last accessed: {format_time_ago(repo.last_accessed)}")
-        console.print(f"      Stats: {repo.commit_count} commits, {repo.branch_count} branches, {repo.file_count} files")
+        lines.append(f"      Last accessed: {format_time_ago(repo.last_accessed, now)}")
+        lines.append(f"      Stats: {repo.commit_count} commits, {repo.branch_count} branches, {repo.file_count} files")
 
         if repo.aliases:
-            console.print(f"      Aliases: {', '.join(repo.aliases)}")
+            lines.append(f"      Aliases: {', '.join(repo.aliases)}")
 
         if not path_exists:
-            print_warning(f"      Path no longer exists!")
+            lines.append(format_warning("      Path no longer exists!"))
 
-        console.print()
+        lines.append("")
 
-    console.print(f"[dim]Total: {len(repositories)} repositories[/dim]")
+    lines.append(f"[dim]Total: {len(repositories)} repositories[/dim]")
+    console.print("\n".join(lines))
 
     if current_repo:
         console.print(f"[dim]Current: {current_repo.name}[/dim]")
@@ -125,16 +135,15 @@ def cmd_register_repository(args):
     repo_name = args.name
     repo_path = args.path if args.path else os.getcwd()
 
-    # Validate path
-    if not os.path.exists(repo_path):
-        print_error(f"Path does not exist: {repo_path}")
-        return
-
-    # Check if it's a git repository
+    # Validate path: an existing .git (directory, or file for worktrees) implies
+    # the path exists, so the path itself is only checked to word the error
     git_dir = os.path.join(repo_path, '.git')
     if not os.path.exists(git_dir):
-        print_error(f"Not a Git repository: {repo_path}")
-        print_info("Initialize with 'git init' first")
+        if not os.path.exists(repo_path):
+            print_error(f"Path does not exist: {repo_path}")
+        else:
+            print_error(f"Not a Git repository: {repo_path}")
+            print_info("Initialize with 'git init' first")
         return
 
     registry = get_repository_registry()
@@ -181,15 +190,11 @@ def cmd_switch_repository(args):
         console.print(f"  Branch: ", end="")
 
         # Get current branch
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True, text=True, check=True
-            )
-            branch = result.stdout.strip()
+        from .git_utils import get_repo_branch
+        branch = get_repo_branch(cwd=repo_info.path)
+        if branch:
             console.print(f"[bold green]{branch}[/bold green]")
-        except:
+        else:
             console.print("[dim]unknown[/dim]")
 
     else:
@@ -273,11 +278,8 @@ def cmd_repository_status(args):
         print_warning("Repository path no longer exists!")
         return
 
-    # Git status (if accessible)
-    original_cwd = os.getcwd()
+    # Git status (if accessible); every git call runs with cwd=repo_info.path
     try:
-        os.chdir(repo_info.path)
-
         # Update and display current stats
         registry.update_repository_stats(repo_info)
         console.print(f"[bold]Statistics:[/bold]")
@@ -286,26 +288,20 @@ def cmd_repository_status(args):
         console.print(f"  Files: {repo_info.file_count}")
 
         # Current branch
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True, text=True, check=True
-            )
-            current_branch = result.stdout.strip()
+        from .git_utils import get_repo_branch
+        current_branch = get_repo_branch(cwd=repo_info.path)
+        if current_branch:
             console.print(f"[bold]Current branch:[/bold] {current_branch}")
-        except:
+        else:
             console.print(f"[bold]Current branch:[/bold] [dim]unknown[/dim]")
 
         # Git status
         try:
-            from .git_utils import get_git_diff, parse_diff
-
-            staged_diff = get_git_diff(staged=True)
-            unstaged_diff = get_git_diff(staged=False)
+            from .git_utils import get_diff_numstat
 
-            staged_files = parse_diff(staged_diff)
-            unstaged_files = parse_diff(unstaged_diff)
+            # Per-file counts only; the patch text itself is never needed here
+            staged_files = get_diff_numstat(staged=True, cwd=repo_info.path)
+            unstaged_files = get_diff_numstat(staged=False, cwd=repo_info.path)
 
             console.print(f"[bold]Working directory:[/bold]")
             console.print(f"  Staged files: {len(staged_files)}")
@@ -330,8 +326,6 @@ def cmd_repository_status(args):
 
     except Exception as e:
         print_error(f"Could not access repository: {e}")
-    finally:
-        os.chdir(original_cwd)
 
 
 def cmd_add_alias(args):
@@ -375,6 +369,45 @@ def cmd_current_repository(args):
         print_info("Use 'gitsmart repo switch <name>' to set a current repository")
 
 
+def _walk_repos(root: str):
+    """
+    Yield git working trees under `root`, depth first.
+
+    Each directory is listed once with os.scandir, which reports entry types
+    without a stat per entry. A directory containing a usable `.git` (a git
+    dir with HEAD, or a worktree/submodule pointer file) is yielded and not
+    descended into; hidden directories and symlinks are never followed, so
+    the walk cannot loop.
+    """
+    stack = deque([root])
+    while stack:
+        path = stack.pop()
+        subdirs = []
+        is_repo = False
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.name == '.git':
+                            # One stat weeds out empty or stray .git dirs before any git spawn
+                            if entry.is_file(follow_symlinks=False):
+                                is_repo = True
+                            elif entry.is_dir(follow_symlinks=False):
+                                is_repo = os.path.lexists(os.path.join(entry.path, 'HEAD'))
+                        elif entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                            subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        if is_repo:
+            yield path
+        else:
+            # Reversed so siblings are visited in listing order
+            stack.extend(reversed(subdirs))
+
+
 def cmd_discover_repositories(args):
     """Discover and register repositories."""
     search_path = args.path if hasattr(args, 'path') and args.path else os.getcwd()
@@ -384,26 +417,24 @@ def cmd_discover_repositories(args):
     registry = get_repository_registry()
     discovered = []
 
+    # Registered paths, resolved once; most candidates are new, and each miss
+    # would otherwise cost a registry lookup
+    known_paths = {os.path.realpath(repo.path): repo.name for repo in registry.list_repositories()}
+
     # Search for git repositories
-    for root, dirs, files in os.walk(search_path):
-        if '.git' in dirs:
-            # Found a git repository
-            repo_path = root
-
-            # Check if already registered
-            existing_repo = registry.find_repository_by_path(repo_path)
-            if existing_repo:
-                console.print(f"[dim]Skipping {repo_path} (already registered as '{existing_repo.name}')[/dim]")
-                continue
-
-            # Discover and register
-            repo_info = registry.discover_repository(repo_path)
-            if repo_info:
-                discovered.append(repo_info)
-                console.print(f"[green]✅ Discovered: {repo_info.name} at {repo_info.path}[/green]")
-
-            # Don't recurse into this git repository
-            dirs[:] = [d for d in dirs if d != '.git']
+    candidates = []
+    for repo_path in _walk_repos(search_path):
+        # Check if already registered
+        known_name = known_paths.get(os.path.realpath(repo_path))
+        if known_name is not None:
+            console.print(f"[dim]Skipping {repo_path} (already registered as '{known_name}')[/dim]")
+            continue
+        candidates.append(repo_path)
+
+    # Discover and register; the per-repository git probes run concurrently
+    for repo_info in registry.discover_repositories(candidates):
+        discovered.append(repo_info)
+        console.print(f"[green]✅ Discovered: {repo_info.name} at {repo_info.path}[/green]")
 
     if discovered:
         print_success(f"Discovered and registered {len(discovered)} repositories")
@@ -51,6 +51,9 @@ class RepositoryManager:
         # Current active repository
         self._current_repo = None
 
+        # (registry_signature, sorted names) from the last list_repository_names()
+        self._names_cache = None
+
         # Initialize logger
         self.logger = logger
 
@@ -190,6 +193,7 @@ class RepositoryManager:
 
             # Store in cache
             self.cache[repo_name] = repo_info
+            self._names_cache = None
 
             if DEBUG:
                 self.logger.debug(f"Registered repository '{repo_name}' at {repo_path}")
@@ -258,6 +262,33 @@ class RepositoryManager:
             self.logger.error(f"Error listing repositories: {e}")
             return {}
 
+    def registry_signature(self) -> tuple:
+        """
+        (mtime_ns, size) of the cache's sqlite files. Changes whenever any process
+        writes to the registry, so in-memory views of it can be keyed on it.
+        """
+        signature = []
+        for name in ("cache.db", "cache.db-wal"):
+            try:
+                st = os.stat(os.path.join(self.cache_dir, name))
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def list_repository_names(self) -> Tuple[str, ...]:
+        """
+        Sorted names of all registered repositories. The tuple is shared and
+        reused until the registry changes, instead of rebuilding every entry.
+        """
+        cached = self._names_cache
+        if cached is not None and cached[0] == self.registry_signature():
+            return cached[1]
+        names = tuple(sorted(self.list_repositories()))
+        # Taken afterwards: list_repositories may prune entries whose path is gone
+        self._names_cache = (self.registry_signature(), names)
+        return names
+
     def remove_repository(self, repo_name: str) -> bool:
         """
         Remove a repository from the registry.
@@ -271,6 +302,7 @@ class RepositoryManager:
         try:
             if repo_name in self.cache:
                 del self.cache[repo_name]
+                self._names_cache = None
                 if DEBUG:
                     self.logger.debug(f"Removed repository '{repo_name}' from registry")
                 return True
@@ -621,6 +653,7 @@ class RepositoryManager:
                 # Verify repository still exists
                 if os.path.exists(repo_info.get("path", "")):
                     self.cache[repo_name] = repo_info
+                    self._names_cache = None
                     imported_count += 1
                 else:
                     self.logger.warning(f"Skipped importing non-existent repository: {repo_name}")
@@ -20,8 +20,21 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 from diskcache import Cache
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 from .config import logger, DEBUG
 from .utils import get_git_root
 
@@ -83,6 +96,9 @@ class RepositoryRegistry:
         # Current active repository
         self._current_repo: Optional[RepositoryInfo] = None
 
+        # Lazily built {"name": name/alias -> repo_id, "path": abspath -> repo_id}; reset on save
+        self._lookup_index: Optional[Dict[str, Dict[str, str]]] = None
+
         # Load existing registry
         self._load_registry()
 
@@ -90,8 +106,8 @@ class RepositoryRegistry:
         """Load the repository registry from persistent storage."""
         try:
             if self.registry_file.exists():
-                with open(self.registry_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.registry_file, 'rb') as f:
+                    data = _json_loads(f.read())
 
                 # Migrate data to cache if needed
                 for repo_id, repo_data in data.get('repositories', {}).items():
@@ -108,6 +124,8 @@ class RepositoryRegistry:
 
     def _save_registry(self):
         """Save the repository registry to persistent storage."""
+        # Every change to names, aliases or membership is followed by a save
+        self._lookup_index = None
         try:
             # Export cache to JSON for backup
             data = {
@@ -121,8 +139,8 @@ class RepositoryRegistry:
                 if isinstance(repo_info, RepositoryInfo):
                     data['repositories'][repo_id] = repo_info.to_dict()
 
-            with open(self.registry_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.registry_file, 'wb') as f:
+                f.write(_json_dumps(data))
 
             if DEBUG:
                 logger.debug(f"Saved {len(data['repositories'])} repositories to registry")
@@ -161,28 +179,26 @@ class RepositoryRegistry:
             Tuple of (branch_count, commit_count, file_count)
         """
         try:
-            os.chdir(repo_path)
-
             # Count branches
             branch_result = subprocess.run(
                 ["git", "branch", "-a"],
-                capture_output=True, text=True, check=True
+                capture_output=True, text=True, check=True, cwd=repo_path
             )
             branch_count = len([line for line in branch_result.stdout.split('\n') if line.strip()])
 
             # Count commits
             commit_result = subprocess.run(
                 ["git", "rev-list", "--count", "HEAD"],
-                capture_output=True, text=True, check=True
+                capture_output=True, text=True, check=True, cwd=repo_path
             )
             commit_count = int(commit_result.stdout.strip())
 
-            # Count tracked files
+            # Count tracked files; only the separators matter, so skip decoding
             file_result = subprocess.run(
-                ["git", "ls-files"],
-                capture_output=True, text=True, check=True
+                ["git", "ls-files", "-z"],
+                capture_output=True, check=True, cwd=repo_path
             )
-            file_count = len([line for line in file_result.stdout.split('\n') if line.strip()])
+            file_count = file_result.stdout.count(b"\0")
 
             return branch_count, commit_count, file_count
 
@@ -202,13 +218,12 @@ class RepositoryRegistry:
             Remote URL or None if not available
         """
         try:
-            os.chdir(repo_path)
             result = subprocess.run(
                 ["git", "remote", "get-url", "origin"],
-                capture_output=True, text=True, check=True
+                capture_output=True, text=True, check=True, cwd=repo_path
             )
             return result.stdout.strip()
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, OSError):
             return None
 
     def _extract_repo_name(self, repo_path: str, remote_url: Optional[str] = None) -> str:
@@ -312,6 +327,74 @@ class RepositoryRegistry:
             except:
                 pass
 
+    def discover_repositories(self, repo_paths: List[str], max_workers: Optional[int] = None) -> List[RepositoryInfo]:
+        """
+        Discover and register several repository roots at once.
+
+        The git probes for each path only wait on subprocesses, so they run on a
+        thread pool; registry writes stay on the calling thread and the JSON
+        backup is saved once for the whole batch.
+
+        Args:
+            repo_paths: Working tree roots, e.g. as found by a directory walk
+            max_workers: Thread pool size (default: min(16, 4 * CPU count))
+
+        Returns:
+            RepositoryInfo for each path that could be read, in input order
+        """
+        def probe(repo_path: str):
+            try:
+                remote_url = self._get_remote_url(repo_path)
+                repo_id = self._generate_repo_id(repo_path, remote_url)
+                stats = None if repo_id in self.cache else self._get_repo_stats(repo_path)
+                return repo_path, remote_url, repo_id, stats
+            except Exception as e:
+                if DEBUG:
+                    logger.error(f"Error discovering repository at {repo_path}: {e}")
+                return None
+
+        # Match the realpath form git reports for --show-toplevel
+        repo_paths = [os.path.realpath(path) for path in repo_paths]
+        if not repo_paths:
+            return []
+        if max_workers is None:
+            max_workers = min(16, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            probes = list(pool.map(probe, repo_paths))
+
+        discovered = []
+        now = time.time()
+        for result in probes:
+            if result is None:
+                continue
+            repo_path, remote_url, repo_id, stats = result
+            if repo_id in self.cache:
+                # Already registered, possibly by an earlier path in this batch
+                repo_info = self.cache[repo_id]
+                repo_info.last_accessed = now
+            else:
+                branch_count, commit_count, file_count = stats or self._get_repo_stats(repo_path)
+                repo_info = RepositoryInfo(
+                    name=self._extract_repo_name(repo_path, remote_url),
+                    path=repo_path,
+                    remote_url=remote_url,
+                    last_accessed=now,
+                    created_at=now,
+                    branch_count=branch_count,
+                    commit_count=commit_count,
+                    file_count=file_count,
+                    repo_id=repo_id,
+                    aliases=[]
+                )
+                if DEBUG:
+                    logger.debug(f"Registered new repository: {repo_info.name} at {repo_path}")
+            self.cache[repo_id] = repo_info
+            discovered.append(repo_info)
+
+        if discovered:
+            self._save_registry()
+        return discovered
+
     def register_repository_by_name(self, repo_name: str, repo_path: str) -> Optional[RepositoryInfo]:
         """
         Manually register a repository with a specific name.
@@ -383,6 +466,43 @@ class RepositoryRegistry:
             except:
                 pass
 
+    def _get_lookup_index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Return the lowercased name/alias -> repo_id and abspath -> repo_id maps,
+        building them with one pass over the cache when missing. Earlier
+        entries win, matching the first-match order of a linear scan.
+        """
+        if self._lookup_index is None:
+            by_name: Dict[str, str] = {}
+            by_path: Dict[str, str] = {}
+            for repo_id in self.cache:
+                repo_info = self.cache.get(repo_id)
+                if isinstance(repo_info, RepositoryInfo):
+                    by_name.setdefault(repo_info.name.lower(), repo_id)
+                    for alias in repo_info.aliases:
+                        by_name.setdefault(alias.lower(), repo_id)
+                    by_path.setdefault(os.path.abspath(repo_info.path), repo_id)
+            self._lookup_index = {"name": by_name, "path": by_path}
+        return self._lookup_index
+
+    def _lookup(self, index: str, key: str, matches) -> Optional[RepositoryInfo]:
+        """
+        Resolve `key` through the "name" or "path" map. Another process may have
+        changed the shared cache since the map was built, so a miss or stale hit
+        on an older map rebuilds it once before giving up.
+        """
+        fresh = self._lookup_index is None
+        while True:
+            repo_id = self._get_lookup_index()[index].get(key)
+            repo_info = self.cache.get(repo_id) if repo_id is not None else None
+            if isinstance(repo_info, RepositoryInfo) and matches(repo_info):
+                return repo_info
+            if fresh:
+                # A miss on a just-built map is a real miss; keep the map
+                return None
+            self._lookup_index = None
+            fresh = True
+
     def find_repository_by_name(self, name: str) -> Optional[RepositoryInfo]:
         """
         Find a repository by name or alias.
@@ -393,17 +513,16 @@ class RepositoryRegistry:
         Returns:
             RepositoryInfo if found, None otherwise
         """
-        for repo_id in self.cache:
-            repo_info = self.cache[repo_id]
-            if isinstance(repo_info, RepositoryInfo):
-                if (repo_info.name.lower() == name.lower() or
-                    name.lower() in [alias.lower() for alias in repo_info.aliases]):
-                    # Update last accessed
-                    repo_info.last_accessed = time.time()
-                    self.cache[repo_id] = repo_info
-                    return repo_info
-
-        return None
+        key = name.lower()
+        repo_info = self._lookup(
+            "name", key,
+            lambda info: info.name.lower() == key or key in (alias.lower() for alias in info.aliases)
+        )
+        if repo_info:
+            # Update last accessed
+            repo_info.last_accessed = time.time()
+            self.cache[repo_info.repo_id] = repo_info
+        return repo_info
 
     def find_repository_by_path(self, path: str) -> Optional[RepositoryInfo]:
         """
@@ -416,17 +535,12 @@ class RepositoryRegistry:
             RepositoryInfo if found, None otherwise
         """
         abs_path = os.path.abspath(path)
-
-        for repo_id in self.cache:
-            repo_info = self.cache[repo_id]
-            if isinstance(repo_info, RepositoryInfo):
-                if os.path.abspath(repo_info.path) == abs_path:
-                    # Update last accessed
-                    repo_info.last_accessed = time.time()
-                    self.cache[repo_id] = repo_info
-                    return repo_info
-
-        return None
+        repo_info = self._lookup("path", abs_path, lambda info: os.path.abspath(info.path) == abs_path)
+        if repo_info:
+            # Update last accessed
+            repo_info.last_accessed = time.time()
+            self.cache[repo_info.repo_id] = repo_info
+        return repo_info
 
     def list_repositories(self) -> List[RepositoryInfo]:
         """
@@ -582,32 +696,28 @@ class RepositoryRegistry:
             True if successful, False otherwise
         """
         try:
-            original_cwd = os.getcwd()
-
-            if self.set_current_repository(repo_info):
-                branch_count, commit_count, file_count = self._get_repo_stats(repo_info.path)
+            if not os.path.isdir(repo_info.path):
+                if DEBUG:
+                    logger.error(f"Repository path does not exist: {repo_info.path}")
+                return False
 
-                repo_info.branch_count = branch_count
-                repo_info.commit_count = commit_count
-                repo_info.file_count = file_count
-                repo_info.last_accessed = time.time()
+            # git runs with cwd=repo_info.path; the process directory is left alone
+            branch_count, commit_count, file_count = self._get_repo_stats(repo_info.path)
 
-                self.cache[repo_info.repo_id] = repo_info
-                self._save_registry()
+            repo_info.branch_count = branch_count
+            repo_info.commit_count = commit_count
+            repo_info.file_count = file_count
+            repo_info.last_accessed = time.time()
 
-                return True
+            self.cache[repo_info.repo_id] = repo_info
+            self._save_registry()
 
-            return False
+            return True
 
         except Exception as e:
             if DEBUG:
                 logger.error(f"Error updating repository stats: {e}")
             return False
-        finally:
-            try:
-                os.chdir(original_cwd)
-            except:
-                pass
 
     def cleanup_invalid_repositories(self) -> int:
         """
@@ -657,8 +767,8 @@ class RepositoryRegistry:
                 if isinstance(repo_info, RepositoryInfo):
                     data['repositories'][repo_id] = repo_info.to_dict()
 
-            with open(export_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(_json_dumps(data))
 
             if DEBUG:
                 logger.debug(f"Exported registry to {export_path}")
@@ -681,8 +791,8 @@ class RepositoryRegistry:
             True if successful, False otherwise
         """
         try:
-            with open(import_path, 'r') as f:
-                data = json.load(f)
+            with open(import_path, 'rb') as f:
+                data = _json_loads(f.read())
 
             imported_count = 0
             for repo_id, repo_data in data.get('repositories', {}).items():
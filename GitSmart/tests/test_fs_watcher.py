@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the filesystem watcher that drives auto-refresh.
+"""
+
+import unittest
+import subprocess
+import tempfile
+import threading
+import time
+import shutil
+import os
+import sys
+
+# Add GitSmart to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GitSmart.fs_watcher import RepoWatcher, WATCHDOG_AVAILABLE
+
+
+class TestRepoWatcher(unittest.TestCase):
+    """Test cases for RepoWatcher path filtering and change notification."""
+
+    def setUp(self):
+        """Set up a throwaway repository with an ignored build directory."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp(prefix="gitsmart_test_"))
+        subprocess.run(["git", "init", "-q", self.test_dir], check=True)
+        with open(os.path.join(self.test_dir, ".gitignore"), "w") as f:
+            f.write("build/\n")
+        os.makedirs(os.path.join(self.test_dir, "build"))
+        self.git_dir = os.path.join(self.test_dir, ".git")
+        self.changed = threading.Event()
+        self.watcher = RepoWatcher(self.test_dir, self.git_dir, self.changed.set, debounce=0.1)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.watcher.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_classify_paths(self):
+        """Only index/HEAD/refs inside .git count; worktree files count; .gitsmart doesn't."""
+        join = os.path.join
+        self.assertEqual(self.watcher._classify(join(self.git_dir, "index")), "git")
+        self.assertEqual(self.watcher._classify(join(self.git_dir, "refs", "heads", "main")), "git")
+        self.assertIsNone(self.watcher._classify(join(self.git_dir, "index.lock")))
+        self.assertIsNone(self.watcher._classify(join(self.git_dir, "objects", "ab", "cdef")))
+        self.assertIsNone(self.watcher._classify(join(self.test_dir, ".gitsmart", "model_cache")))
+        self.assertEqual(self.watcher._classify(join(self.test_dir, "src.py")), "tree")
+
+    def test_ignored_paths_filtered(self):
+        """A burst touching only ignored files is dropped."""
+        self.assertFalse(self.watcher._any_not_ignored(["build/out.o"]))
+        self.assertTrue(self.watcher._any_not_ignored(["build/out.o", "main.py"]))
+
+    @unittest.skipUnless(WATCHDOG_AVAILABLE, "watchdog not installed")
+    def test_worktree_edit_triggers_callback(self):
+        """Writing a tracked-area file fires the debounced callback."""
+        self.assertTrue(self.watcher.start())
+        with open(os.path.join(self.test_dir, "main.py"), "w") as f:
+            f.write("print('hi')\n")
+        self.assertTrue(self.changed.wait(timeout=5))
+
+    @unittest.skipUnless(WATCHDOG_AVAILABLE, "watchdog not installed")
+    def test_ignored_build_writes_do_not_trigger_callback(self):
+        """Churn confined to an ignored directory never reaches the callback."""
+        self.assertTrue(self.watcher.start())
+        for n in range(5):
+            with open(os.path.join(self.test_dir, "build", f"out{n}.o"), "w") as f:
+                f.write("object\n")
+        self.assertFalse(self.changed.wait(timeout=1))
+
+    @unittest.skipUnless(WATCHDOG_AVAILABLE, "watchdog not installed")
+    def test_git_reads_do_not_trigger_callback(self):
+        """Reading the repository (as the refresh itself does) isn't a change."""
+        # Backdated so git status has no racily-clean entry to rewrite the index for
+        past = time.time() - 60
+        os.utime(os.path.join(self.test_dir, ".gitignore"), (past, past))
+        subprocess.run(["git", "add", ".gitignore"], check=True, cwd=self.test_dir)
+        subprocess.run(
+            ["git", "-c", "user.name=Test User", "-c", "user.email=test@example.com",
+             "commit", "-q", "-m", "Initial commit"],
+            check=True, cwd=self.test_dir
+        )
+        self.assertTrue(self.watcher.start())
+        for _ in range(3):
+            subprocess.run(["git", "status"], check=True, cwd=self.test_dir, stdout=subprocess.DEVNULL)
+            subprocess.run(["git", "rev-parse", "HEAD"], check=True, cwd=self.test_dir, stdout=subprocess.DEVNULL)
+        self.assertFalse(self.changed.wait(timeout=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the git_utils helpers used by the CLI status loop.
+"""
+
+import unittest
+import subprocess
+import tempfile
+import shutil
+import os
+import sys
+import contextlib
+from unittest import mock
+
+# Add GitSmart to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GitSmart.git_utils import (
+    get_index_fingerprint,
+    get_worktree_fingerprint,
+    get_status_digest,
+    change_totals,
+    get_diff_numstat,
+    add_files,
+    split_add_candidates,
+    commit_in_process,
+    PYGIT2_AVAILABLE
+)
+
+
+class TestIndexFingerprint(unittest.TestCase):
+    """Test cases for the index fingerprint used to skip redundant status calls."""
+
+    def setUp(self):
+        """Set up a throwaway repository with one commit."""
+        self.original_dir = os.getcwd()
+        self.test_dir = tempfile.mkdtemp(prefix="gitsmart_test_")
+        os.chdir(self.test_dir)
+        subprocess.run(["git", "init", "-q"], check=True)
+        subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
+        subprocess.run(["git", "config", "user.name", "Test User"], check=True)
+        with open("README.md", "w") as f:
+            f.write("# Test\n")
+        subprocess.run(["git", "add", "README.md"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], check=True)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_fingerprint_stable_without_changes(self):
+        """Two reads with no git activity in between should match."""
+        first = get_index_fingerprint()
+        self.assertIsNotNone(first)
+        self.assertEqual(first, get_index_fingerprint())
+
+    def test_fingerprint_changes_when_staging(self):
+        """Staging a file rewrites the index and changes the fingerprint."""
+        before = get_index_fingerprint()
+        with open("new_file.txt", "w") as f:
+            f.write("some content that changes the index size\n")
+        subprocess.run(["git", "add", "new_file.txt"], check=True)
+        self.assertNotEqual(before, get_index_fingerprint())
+
+    def test_worktree_fingerprint_tracks_edits(self):
+        """Editing a tracked file changes the worktree fingerprint without touching the index."""
+        before = get_worktree_fingerprint()
+        self.assertIsNotNone(before)
+        self.assertEqual(before, get_worktree_fingerprint())
+        with open("README.md", "w") as f:
+            f.write("# Test\nmore text\n")
+        after = get_worktree_fingerprint()
+        self.assertEqual(before[0], after[0])
+        self.assertNotEqual(before, after)
+
+    def test_split_add_candidates(self):
+        """One index lookup separates missing, tracked (files and directories) and new paths."""
+        os.makedirs("docs")
+        with open(os.path.join("docs", "guide.md"), "w") as f:
+            f.write("guide\n")
+        subprocess.run(["git", "add", "docs"], check=True)
+        with open("new.txt", "w") as f:
+            f.write("new\n")
+        missing, tracked, untracked = split_add_candidates(
+            ["README.md", "./docs", "gone.txt", "new.txt", os.path.abspath("README.md")]
+        )
+        self.assertEqual(missing, ["gone.txt"])
+        self.assertEqual(tracked, ["README.md", "./docs", os.path.abspath("README.md")])
+        self.assertEqual(untracked, ["new.txt"])
+
+        # Relative paths resolve against cwd, not wherever the process happens to be
+        os.chdir(self.original_dir)
+        missing, tracked, untracked = split_add_candidates(
+            ["gone.txt", "docs", "new.txt", "README.md"], cwd=self.test_dir
+        )
+        self.assertEqual(missing, ["gone.txt"])
+        self.assertEqual(tracked, ["docs", "README.md"])
+        self.assertEqual(untracked, ["new.txt"])
+
+        # Once added, the new file counts as tracked
+        add_files(untracked, cwd=self.test_dir)
+        missing, tracked, untracked = split_add_candidates(["new.txt"], cwd=self.test_dir)
+        self.assertEqual((missing, tracked, untracked), ([], ["new.txt"], []))
+
+    @unittest.skipUnless(PYGIT2_AVAILABLE, "pygit2 not installed")
+    def test_commit_in_process(self):
+        """Staged changes are committed in-process; hooks or an empty index defer to git."""
+        self.assertFalse(commit_in_process("Nothing staged"))
+        with open("README.md", "a") as f:
+            f.write("more\n")
+        subprocess.run(["git", "add", "README.md"], check=True)
+        self.assertTrue(commit_in_process("Update readme  \n\n"))
+        log = subprocess.run(["git", "log", "-1", "--format=%B"], capture_output=True, text=True, check=True)
+        self.assertEqual(log.stdout, "Update readme\n\n")
+
+        with open("README.md", "a") as f:
+            f.write("again\n")
+        subprocess.run(["git", "add", "README.md"], check=True)
+        with open(os.path.join(".git", "hooks", "pre-commit"), "w") as f:
+            f.write("#!/bin/sh\n")
+        self.assertFalse(commit_in_process("Hooked"))
+
+    @unittest.skipUnless(PYGIT2_AVAILABLE, "pygit2 not installed")
+    def test_commit_in_process_honours_identity_env(self):
+        """GIT_AUTHOR_*/GIT_COMMITTER_* override the configured identity, as with git commit."""
+        with open("README.md", "a") as f:
+            f.write("env\n")
+        subprocess.run(["git", "add", "README.md"], check=True)
+        env = {
+            "GIT_AUTHOR_NAME": "Env Author", "GIT_AUTHOR_EMAIL": "author@env.test",
+            "GIT_COMMITTER_NAME": "Env Committer",
+        }
+        with mock.patch.dict(os.environ, env):
+            self.assertTrue(commit_in_process("Env identity"))
+        log = subprocess.run(
+            ["git", "log", "-1", "--format=%an <%ae>|%cn <%ce>"],
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(log.stdout.strip(), "Env Author <author@env.test>|Env Committer <test@example.com>")
+
+        # A date override is left to git, which parses formats libgit2 doesn't
+        with open("README.md", "a") as f:
+            f.write("dated\n")
+        subprocess.run(["git", "add", "README.md"], check=True)
+        with mock.patch.dict(os.environ, {"GIT_AUTHOR_DATE": "2005-04-07T22:13:13"}):
+            self.assertFalse(commit_in_process("Dated"))
+
+    @unittest.skipUnless(PYGIT2_AVAILABLE, "pygit2 not installed")
+    def test_commit_in_process_defers_to_role_identity_config(self):
+        """author.*/committer.* config is resolved by git, not the in-process commit."""
+        with open("README.md", "a") as f:
+            f.write("role config\n")
+        subprocess.run(["git", "add", "README.md"], check=True)
+        for key in ("author.name", "committer.email"):
+            with self.subTest(key=key):
+                subprocess.run(["git", "config", key, "Role Identity"], check=True)
+                self.assertFalse(commit_in_process("Role identity"))
+                subprocess.run(["git", "config", "--unset", key], check=True)
+        self.assertTrue(commit_in_process("Role identity"))
+
+
+class TestStatusDigest(unittest.TestCase):
+    """Test cases for the working tree status digest, on both backends."""
+
+    def setUp(self):
+        self.original_dir = os.getcwd()
+        self.test_dir = tempfile.mkdtemp(prefix="gitsmart_test_")
+        os.chdir(self.test_dir)
+        subprocess.run(["git", "init", "-q"], check=True)
+        subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
+        subprocess.run(["git", "config", "user.name", "Test User"], check=True)
+        with open("a.txt", "w") as f:
+            f.write("one\n")
+        subprocess.run(["git", "add", "a.txt"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], check=True)
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _backends(self):
+        """The libgit2 path when available, and always the git fallback."""
+        backends = [("git", mock.patch("GitSmart.git_utils.get_pygit2_repo", return_value=None))]
+        if PYGIT2_AVAILABLE:
+            backends.insert(0, ("pygit2", contextlib.nullcontext()))
+        return backends
+
+    def test_digest_tracks_repeat_edits(self):
+        """Editing an already-modified file again changes the digest."""
+        for name, backend in self._backends():
+            with self.subTest(backend=name), backend:
+                subprocess.run(["git", "checkout", "-q", "--", "a.txt"], check=True)
+                clean_digest = get_status_digest()
+                with open("a.txt", "w") as f:
+                    f.write("two\n")
+                first_digest = get_status_digest()
+                self.assertNotEqual(clean_digest, first_digest)
+                self.assertEqual(first_digest, get_status_digest())
+                with open("a.txt", "w") as f:
+                    f.write("three more\n")
+                self.assertNotEqual(first_digest, get_status_digest())
+
+    def test_digest_counts_untracked_files(self):
+        """Creating or editing an untracked file changes the digest; ignored files don't."""
+        with open(".gitignore", "w") as f:
+            f.write("*.log\n")
+        for name, backend in self._backends():
+            with self.subTest(backend=name), backend:
+                if os.path.exists("new.txt"):
+                    os.remove("new.txt")
+                before = get_status_digest()
+                with open("debug.log", "w") as f:
+                    f.write("ignored\n")
+                self.assertEqual(before, get_status_digest())
+                with open("new.txt", "w") as f:
+                    f.write("new\n")
+                created = get_status_digest()
+                self.assertNotEqual(before, created)
+                with open("new.txt", "w") as f:
+                    f.write("newer and longer\n")
+                self.assertNotEqual(created, get_status_digest())
+
+
+class TestDiffNumstat(unittest.TestCase):
+    """Test cases for the numstat-based per-file change counts."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="gitsmart_test_")
+        self.git("init", "-q")
+        self.git("config", "user.email", "test@example.com")
+        self.git("config", "user.name", "Test User")
+        self.write("notes.txt", "".join(f"line {n}\n" for n in range(20)))
+        self.write("logo.bin", b"\x00\x01binary\x00")
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "Initial commit")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def git(self, *args):
+        subprocess.run(["git", *args], check=True, cwd=self.test_dir)
+
+    def write(self, name, content):
+        mode = "wb" if isinstance(content, bytes) else "w"
+        with open(os.path.join(self.test_dir, name), mode) as f:
+            f.write(content)
+
+    def test_staged_and_unstaged_counts(self):
+        self.write("notes.txt", "".join(f"line {n}\n" for n in range(18)) + "extra\n")
+        self.write("new file.txt", "a\nb\n")
+        self.git("add", "new file.txt")
+        self.assertEqual(get_diff_numstat(staged=True, cwd=self.test_dir), [
+            {"file": "new file.txt", "additions": 2, "deletions": 0},
+        ])
+        self.assertEqual(get_diff_numstat(staged=False, cwd=self.test_dir), [
+            {"file": "notes.txt", "additions": 1, "deletions": 2},
+        ])
+
+    def test_binary_rows_count_as_zero(self):
+        self.write("logo.bin", b"\x00\x02changed\x00")
+        self.git("add", "logo.bin")
+        self.assertEqual(get_diff_numstat(cwd=self.test_dir), [
+            {"file": "logo.bin", "additions": 0, "deletions": 0},
+        ])
+
+    def test_rename_reports_new_path(self):
+        self.git("mv", "notes.txt", "renamed notes.txt")
+        with open(os.path.join(self.test_dir, "renamed notes.txt"), "a") as f:
+            f.write("appended\n")
+        self.git("add", "renamed notes.txt")
+        self.write("after.txt", "x\n")
+        self.git("add", "after.txt")
+        self.assertEqual(get_diff_numstat(cwd=self.test_dir), [
+            {"file": "after.txt", "additions": 1, "deletions": 0},
+            {"file": "renamed notes.txt", "additions": 1, "deletions": 0},
+        ])
+
+    def test_no_changes(self):
+        self.assertEqual(get_diff_numstat(cwd=self.test_dir), [])
+        self.assertEqual(get_diff_numstat(staged=False, cwd=self.test_dir), [])
+
+
+class TestChangeTotals(unittest.TestCase):
+    """Test cases for the single-pass additions/deletions totals."""
+
+    def test_totals_across_lists(self):
+        """Totals cover every list passed and are zero for no changes."""
+        staged = [{"file": "a.py", "additions": 3, "deletions": 1}]
+        unstaged = [
+            {"file": "b.py", "additions": 2, "deletions": 5},
+            {"file": "c.py", "additions": 0, "deletions": 4},
+        ]
+        self.assertEqual(change_totals(staged, unstaged), (5, 10))
+        self.assertEqual(change_totals(staged), (3, 1))
+        self.assertEqual(change_totals([], []), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MCP server's generated commit-message cache.
+"""
+
+import unittest
+import asyncio
+import subprocess
+import os
+import sys
+from unittest import mock
+
+# Add GitSmart to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GitSmart import mcp_server
+
+
+class TestCommitMessageCache(unittest.TestCase):
+    """The generated-message cache only keeps messages that committed."""
+
+    def setUp(self):
+        mcp_server._commit_message_cache.clear()
+        self.addCleanup(mcp_server._commit_message_cache.clear)
+        self.generate = mock.Mock(side_effect=["First message", "Second message"])
+        patches = [
+            mock.patch.object(mcp_server, "ensure_repo_context", return_value={"name": "repo", "path": "/tmp/repo"}),
+            mock.patch.object(mcp_server, "get_git_diff", return_value="diff --git a/x b/x\n+change\n"),
+            mock.patch.object(mcp_server, "generate_commit_message", self.generate),
+            mock.patch.object(mcp_server, "commit_in_process", return_value=False),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _commit(self, returncode):
+        git_result = subprocess.CompletedProcess([], returncode, stdout="", stderr="hook rejected")
+        with mock.patch.object(mcp_server.subprocess, "run", return_value=git_result):
+            return asyncio.run(mcp_server.generate_commit_and_commit(repo_name="repo"))
+
+    def test_failed_commit_regenerates_message(self):
+        """A message whose commit failed is not reused by the retry."""
+        result = self._commit(returncode=1)
+        self.assertFalse(result["success"])
+        self.assertEqual(len(mcp_server._commit_message_cache), 0)
+
+        result = self._commit(returncode=0)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["message"], "Committed: Second message")
+        self.assertEqual(self.generate.call_count, 2)
+
+    def test_successful_commit_is_cached(self):
+        """The same staged diff committed again reuses the message."""
+        self.assertTrue(self._commit(returncode=0)["success"])
+        self.assertTrue(self._commit(returncode=0)["success"])
+        self.assertEqual(self.generate.call_count, 1)
+        self.assertEqual(list(mcp_server._commit_message_cache.values()), ["First message"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the repository management CLI helpers.
+"""
+
+import unittest
+import subprocess
+import tempfile
+import shutil
+import argparse
+import os
+import sys
+from unittest import mock
+
+# Add GitSmart to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GitSmart import repo_cli
+from GitSmart.repo_cli import _walk_repos, format_time_ago, format_warning
+from GitSmart.repo_registry import RepositoryRegistry
+
+
+class TestFormatTimeAgo(unittest.TestCase):
+    """Test cases for the relative timestamps in `repo list`."""
+
+    NOW = 1_700_000_000.0
+
+    def ago(self, seconds: float) -> str:
+        return format_time_ago(self.NOW - seconds, now=self.NOW)
+
+    def test_bucket_boundaries(self):
+        cases = [
+            (0, "just now"),
+            (59, "just now"),
+            (60, "1 minute ago"),
+            (119, "1 minute ago"),
+            (120, "2 minutes ago"),
+            (3599, "59 minutes ago"),
+            (3600, "1 hour ago"),
+            (7200, "2 hours ago"),
+            (86399, "23 hours ago"),
+            (86400, "1 day ago"),
+            (86400 * 30, "30 days ago"),
+        ]
+        for seconds, expected in cases:
+            with self.subTest(seconds=seconds):
+                self.assertEqual(self.ago(seconds), expected)
+
+    def test_future_timestamp_is_just_now(self):
+        self.assertEqual(self.ago(-30), "just now")
+
+
+class TestFormatWarning(unittest.TestCase):
+    """Test cases for the shared warning markup."""
+
+    def test_print_warning_uses_format_warning(self):
+        self.assertEqual(format_warning("Careful"), "[bold yellow]⚠️  Careful[/bold yellow]")
+        with mock.patch.object(repo_cli.console, "print") as console_print:
+            repo_cli.print_warning("Careful")
+        console_print.assert_called_once_with(format_warning("Careful"))
+
+
+class TestWalkRepos(unittest.TestCase):
+    """Test cases for the scandir walk that finds repositories to discover."""
+
+    def setUp(self):
+        self.root = os.path.realpath(tempfile.mkdtemp(prefix="gitsmart_walk_"))
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def make_dir(self, *parts: str) -> str:
+        path = os.path.join(self.root, *parts)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def touch(self, *parts: str, content: str = "") -> None:
+        with open(os.path.join(self.root, *parts), "w") as f:
+            f.write(content)
+
+    def test_git_dir_with_head_is_a_repo(self):
+        repo = self.make_dir("project", ".git")
+        self.touch("project", ".git", "HEAD", content="ref: refs/heads/main\n")
+        self.make_dir("project", "src", "nested", ".git")
+        self.touch("project", "src", "nested", ".git", "HEAD")
+        # Not descended into once identified
+        self.assertEqual(list(_walk_repos(self.root)), [os.path.dirname(repo)])
+
+    def test_git_file_is_a_repo(self):
+        self.make_dir("worktree")
+        self.touch("worktree", ".git", content="gitdir: /elsewhere/.git/worktrees/worktree\n")
+        self.assertEqual(list(_walk_repos(self.root)), [os.path.join(self.root, "worktree")])
+
+    def test_git_dir_without_head_is_skipped(self):
+        self.make_dir("stray", ".git", "objects")
+        self.make_dir("stray", "inner", ".git")
+        self.touch("stray", "inner", ".git", "HEAD")
+        # The stray .git doesn't count, so the walk keeps going below it
+        self.assertEqual(list(_walk_repos(self.root)), [os.path.join(self.root, "stray", "inner")])
+
+    def test_hidden_dirs_and_symlinks_are_not_followed(self):
+        self.make_dir(".cache", "repo", ".git")
+        self.touch(".cache", "repo", ".git", "HEAD")
+        self.make_dir("real", ".git")
+        self.touch("real", ".git", "HEAD")
+        try:
+            os.symlink(os.path.join(self.root, "real"), os.path.join(self.root, "link"))
+        except (OSError, NotImplementedError):
+            pass
+        self.assertEqual(list(_walk_repos(self.root)), [os.path.join(self.root, "real")])
+
+    def test_siblings_in_listing_order(self):
+        for name in ("b", "a", "c"):
+            self.make_dir(name, ".git")
+            self.touch(name, ".git", "HEAD")
+        with os.scandir(self.root) as entries:
+            expected = [entry.path for entry in entries]
+        self.assertEqual(list(_walk_repos(self.root)), expected)
+
+
+class TestDiscoverCommand(unittest.TestCase):
+    """Test cases for `repo discover` against a temporary registry."""
+
+    def setUp(self):
+        self.original_dir = os.getcwd()
+        self.root = os.path.realpath(tempfile.mkdtemp(prefix="gitsmart_discover_"))
+        self.registry_dir = tempfile.mkdtemp(prefix="gitsmart_registry_")
+        self.registry = RepositoryRegistry(registry_path=self.registry_dir)
+        patcher = mock.patch.object(repo_cli, "get_repository_registry", return_value=self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        self.registry.cache.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+        shutil.rmtree(self.registry_dir, ignore_errors=True)
+
+    def make_repo(self, name: str) -> str:
+        path = os.path.join(self.root, name)
+        os.makedirs(path)
+        subprocess.run(["git", "init", "-q"], check=True, cwd=path)
+        return path
+
+    def test_known_paths_are_skipped(self):
+        known = self.make_repo("known")
+        new = self.make_repo("new")
+        self.registry.register_repository_by_name("already-here", known)
+
+        with mock.patch.object(self.registry, "discover_repositories",
+                               wraps=self.registry.discover_repositories) as discover:
+            repo_cli.cmd_discover_repositories(argparse.Namespace(path=self.root))
+        discover.assert_called_once_with([new])
+
+        names = sorted(repo.name for repo in self.registry.list_repositories())
+        self.assertEqual(names, ["already-here", "new"])
+
+
+if __name__ == '__main__':
+    unittest.main()
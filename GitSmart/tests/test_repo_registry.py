@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the repository registry's lookup index and batch discovery.
+"""
+
+import unittest
+import subprocess
+import tempfile
+import shutil
+import os
+import sys
+from unittest import mock
+
+# Add GitSmart to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from GitSmart.repo_registry import RepositoryRegistry, RepositoryInfo
+
+
+def make_repo(parent: str, name: str) -> str:
+    """Create a git repository with one commit under parent and return its realpath."""
+    path = os.path.join(parent, name)
+    os.makedirs(path)
+    subprocess.run(["git", "init", "-q"], check=True, cwd=path)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], check=True, cwd=path)
+    subprocess.run(["git", "config", "user.name", "Test User"], check=True, cwd=path)
+    with open(os.path.join(path, "README.md"), "w") as f:
+        f.write(f"# {name}\n")
+    subprocess.run(["git", "add", "README.md"], check=True, cwd=path)
+    subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], check=True, cwd=path)
+    return os.path.realpath(path)
+
+
+class RegistryTestCase(unittest.TestCase):
+    """Temporary registry directory plus a scratch directory for repositories."""
+
+    def setUp(self):
+        self.registry_dir = tempfile.mkdtemp(prefix="gitsmart_registry_")
+        self.work_dir = tempfile.mkdtemp(prefix="gitsmart_repos_")
+        self.registries = []
+
+    def tearDown(self):
+        for registry in self.registries:
+            registry.cache.close()
+        shutil.rmtree(self.registry_dir, ignore_errors=True)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def open_registry(self) -> RepositoryRegistry:
+        """Another RepositoryRegistry on the same storage, as a second process would have."""
+        registry = RepositoryRegistry(registry_path=self.registry_dir)
+        self.registries.append(registry)
+        return registry
+
+
+class TestLookupIndex(RegistryTestCase):
+    """The name/path index stays correct when the registry changes underneath it."""
+
+    def test_lookup_by_name_alias_and_path(self):
+        registry = self.open_registry()
+        path = make_repo(self.work_dir, "alpha")
+        repo = registry.register_repository_by_name("Alpha", path)
+        registry.add_alias("alpha", "al")
+
+        self.assertEqual(registry.find_repository_by_name("ALPHA").repo_id, repo.repo_id)
+        self.assertEqual(registry.find_repository_by_name("Al").repo_id, repo.repo_id)
+        self.assertEqual(registry.find_repository_by_path(path + os.sep).repo_id, repo.repo_id)
+        self.assertIsNone(registry.find_repository_by_name("missing"))
+
+    def test_add_invalidates_index(self):
+        registry = self.open_registry()
+        self.assertIsNone(registry.find_repository_by_name("alpha"))
+        # A miss on a freshly built index keeps it for the next lookup
+        self.assertIsNotNone(registry._lookup_index)
+
+        path = make_repo(self.work_dir, "alpha")
+        registry.register_repository_by_name("alpha", path)
+        self.assertIsNone(registry._lookup_index)
+        self.assertIsNotNone(registry.find_repository_by_name("alpha"))
+        self.assertIsNotNone(registry.find_repository_by_path(path))
+
+    def test_remove_invalidates_index(self):
+        registry = self.open_registry()
+        path = make_repo(self.work_dir, "alpha")
+        registry.register_repository_by_name("alpha", path)
+        self.assertIsNotNone(registry.find_repository_by_path(path))
+
+        self.assertTrue(registry.remove_repository("alpha"))
+        self.assertIsNone(registry.find_repository_by_name("alpha"))
+        self.assertIsNone(registry.find_repository_by_path(path))
+
+    def test_rename_keeps_old_name_as_alias(self):
+        registry = self.open_registry()
+        path = make_repo(self.work_dir, "alpha")
+        repo = registry.register_repository_by_name("alpha", path)
+        self.assertIsNotNone(registry.find_repository_by_name("alpha"))
+
+        registry.register_repository_by_name("renamed", path)
+        self.assertEqual(registry.find_repository_by_name("renamed").repo_id, repo.repo_id)
+        self.assertEqual(registry.find_repository_by_name("alpha").name, "renamed")
+
+    def test_changes_from_another_instance(self):
+        """A stale index misses or mismatches, rebuilds once and sees the other writer's change."""
+        writer = self.open_registry()
+        reader = self.open_registry()
+        path = make_repo(self.work_dir, "alpha")
+
+        # Miss on an index built before the repository existed
+        self.assertIsNone(reader.find_repository_by_name("alpha"))
+        repo = writer.register_repository_by_name("alpha", path)
+        self.assertEqual(reader.find_repository_by_name("alpha").repo_id, repo.repo_id)
+
+        # Stale hit: the old name still maps to a repository that is now called something else
+        renamed = RepositoryInfo.from_dict({**repo.to_dict(), "name": "beta", "aliases": []})
+        writer.cache[repo.repo_id] = renamed
+        writer._save_registry()
+        self.assertIsNone(reader.find_repository_by_name("alpha"))
+        self.assertEqual(reader.find_repository_by_name("beta").repo_id, repo.repo_id)
+
+        # Stale hit on a removed repository
+        writer.remove_repository("beta")
+        self.assertIsNone(reader.find_repository_by_path(path))
+
+    def test_reload_builds_index_from_saved_registry(self):
+        registry = self.open_registry()
+        path = make_repo(self.work_dir, "alpha")
+        repo = registry.register_repository_by_name("alpha", path)
+        registry.add_alias("alpha", "al")
+        registry.cache.close()
+
+        # Drop the cache so the new instance reloads everything from the JSON backup
+        shutil.rmtree(os.path.join(self.registry_dir, "repo_cache"))
+        reloaded = self.open_registry()
+        self.assertEqual(reloaded.find_repository_by_name("al").repo_id, repo.repo_id)
+        self.assertEqual(reloaded.find_repository_by_path(path).repo_id, repo.repo_id)
+
+
+class TestDiscoverRepositories(RegistryTestCase):
+    """Batch discovery probes repositories on a thread pool."""
+
+    def test_discovers_in_input_order_with_one_save(self):
+        registry = self.open_registry()
+        paths = [make_repo(self.work_dir, name) for name in ("one", "two", "three")]
+        with mock.patch.object(registry, "_save_registry", wraps=registry._save_registry) as save:
+            found = registry.discover_repositories(paths + [paths[0]], max_workers=3)
+        self.assertEqual([repo.name for repo in found], ["one", "two", "three", "one"])
+        self.assertEqual([repo.path for repo in found[:3]], paths)
+        self.assertEqual(found[0].repo_id, found[3].repo_id)
+        self.assertEqual(found[1].commit_count, 1)
+        self.assertEqual(found[1].file_count, 1)
+        save.assert_called_once()
+
+        self.assertEqual(len(registry.list_repositories()), 3)
+        self.assertEqual(registry.find_repository_by_name("two").path, paths[1])
+
+    def test_rediscovery_keeps_registration(self):
+        registry = self.open_registry()
+        path = make_repo(self.work_dir, "alpha")
+        first = registry.discover_repositories([path])[0]
+        with mock.patch.object(registry, "_get_repo_stats") as stats:
+            again = registry.discover_repositories([path])[0]
+        stats.assert_not_called()
+        self.assertEqual(again.repo_id, first.repo_id)
+        self.assertGreaterEqual(again.last_accessed, first.last_accessed)
+
+    def test_empty_batch(self):
+        registry = self.open_registry()
+        with mock.patch.object(registry, "_save_registry") as save:
+            self.assertEqual(registry.discover_repositories([]), [])
+        save.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ setup(
     description="AI-Powered Git Commit Assistant",
     author="Andrew Clark",
     packages=find_packages(),  # or ["GitSmart"] if you prefer explicitly
+    package_data={"GitSmart": ["prompt_templates/*.txt"]},
     install_requires=[
         "questionary>=1.10.0",
         "rich>=13.0.0",
@@ -16,7 +17,21 @@ setup(
         "diskcache",
         "flask>=2.0.0",
         "flask-cors>=3.0.0",
+        "sseclient-py",
+        "mcp",
     ],
+    # Each is imported behind a try/except and only speeds things up when present
+    extras_require={
+        "fast": [
+            "watchdog",
+            "pygit2",
+            "orjson",
+            'uvloop; sys_platform != "win32"',
+            "httptools",
+        ],
+        # MCP server process checks; without it they fall back to /proc and signal 0
+        "mcp": ["psutil"],
+    },
     entry_points={
         "console_scripts": [
             "gitsmart = GitSmart.main:entry_point",